@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from exoyone import ExoyOne
-from homeassistant.const import CONF_HOST, Platform
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from exoyone import ExoyOneException, ExoyOneTimeoutError
+from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL, Platform
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.loader import async_get_loaded_integration
 
+from .connection import async_get_connection_manager
+from .const import (
+    CONF_TRACE,
+    DEFAULT_IDLE_INTERVAL,
+    DOMAIN,
+    STORAGE_VERSION,
+    TRACE_OFF,
+)
 from .coordinator import ExoyOneDataUpdateCoordinator
-from .data import ExoyOneData
+from .data import ExoyOneData, ExoyOneDevice
+from .scheduler import async_get_poll_scheduler
+from .services import async_setup_services
+from .tracing import Tracer
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import ExoyOneConfigEntry
 
@@ -25,26 +44,67 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the ExoyONE services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ExoyOneConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
-    coordinator = ExoyOneDataUpdateCoordinator(hass)
-    exoyone = ExoyOne(host=entry.data[CONF_HOST])
-    await exoyone.async_get_data()
-
+    scheduler = async_get_poll_scheduler(hass)
+    scheduler.async_register(entry.entry_id)
+    entry.async_on_unload(partial(scheduler.async_unregister, entry.entry_id))
+
+    store = _async_get_store(hass, entry)
+    coordinator = ExoyOneDataUpdateCoordinator(
+        hass,
+        idle_interval=timedelta(
+            seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_IDLE_INTERVAL)
+        ),
+        scheduler=scheduler,
+        store=store,
+        tracer=Tracer(entry.title, entry.options.get(CONF_TRACE, TRACE_OFF)),
+    )
+    connections = async_get_connection_manager(hass)
     entry.runtime_data = ExoyOneData(
-        exoyone=exoyone,
+        exoyone=connections.async_acquire(entry.data[CONF_HOST]),
+        host=entry.data[CONF_HOST],
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
     )
-
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(lambda: connections.async_release(entry.runtime_data.host))
+    coordinator.async_bind_client()
+
+    if (cache := await store.async_load()) and coordinator.async_restore(cache):
+        # Create the entities from the cached state right away and let the
+        # first live refresh run in the background.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.title} refresh"
+        )
+    elif device := _async_get_registered_device(hass, entry):
+        # Without a cached state, a known device starts out unavailable and
+        # comes online once a background refresh reaches it.
+        coordinator.async_restore_device(device)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {entry.title} refresh"
+        )
+    else:
+        try:
+            await entry.runtime_data.exoyone.async_get_data()
+        except (ExoyOneTimeoutError, ExoyOneException) as exception:
+            raise ConfigEntryNotReady(exception) from exception
+        coordinator.async_set_initial_data()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_entry))
+    coordinator.push.async_start()
 
     return True
 
@@ -57,10 +117,59 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
-async def async_reload_entry(
+async def async_remove_entry(
     hass: HomeAssistant,
     entry: ExoyOneConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Remove the cached state of a deleted entry."""
+    await _async_get_store(hass, entry).async_remove()
+
+
+async def async_update_entry(
+    hass: HomeAssistant,
+    entry: ExoyOneConfigEntry,
+) -> None:
+    """Apply a new host or new options without reloading the platforms."""
+    runtime_data = entry.runtime_data
+    coordinator = runtime_data.coordinator
+    coordinator.async_set_idle_interval(
+        timedelta(seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_IDLE_INTERVAL))
+    )
+    coordinator.tracer.configure(entry.options.get(CONF_TRACE, TRACE_OFF))
+
+    if (host := entry.data[CONF_HOST]) != runtime_data.host:
+        # The device moved to a new address: rebind to a client for it and
+        # refresh once, keeping all entities in place.
+        connections = async_get_connection_manager(hass)
+        runtime_data.exoyone = connections.async_acquire(host)
+        connections.async_release(runtime_data.host)
+        runtime_data.host = host
+        coordinator.async_bind_client()
+        coordinator.push.async_restart()
+        await coordinator.async_refresh()
+
+
+@callback
+def _async_get_store(
+    hass: HomeAssistant, entry: ExoyOneConfigEntry
+) -> Store[dict[str, Any]]:
+    """Return the store holding the last known state of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+@callback
+def _async_get_registered_device(
+    hass: HomeAssistant, entry: ExoyOneConfigEntry
+) -> ExoyOneDevice | None:
+    """Return the identity of the device from the device registry."""
+    device_entry = dr.async_get(hass).async_get_device(
+        identifiers={(DOMAIN, entry.unique_id)}
+    )
+    if device_entry is None:
+        return None
+    return ExoyOneDevice(
+        mdns_name=entry.unique_id,
+        name=device_entry.name,
+        firmware_version=device_entry.sw_version,
+        model_id=device_entry.model_id,
+    )
@@ -0,0 +1,213 @@
+"""Declarative table of the per-key ExoyONE attributes."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from exoyone import ExoyOne
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
+    from .snapshot import ExoyOneSnapshot
+
+
+def _always(_data: ExoyOneSnapshot) -> bool:
+    """Return True; the attribute is always available."""
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class ExoyOneAttribute:
+    """How one entity key is read from and written to the device."""
+
+    key: str
+    read: Callable[[ExoyOneDataUpdateCoordinator], Any]
+    method: str | None = None
+    # Returns the state field values a write results in and the argument
+    # passed to the device method.
+    write: (
+        Callable[[ExoyOneDataUpdateCoordinator, Any], tuple[dict[str, Any], Any]] | None
+    ) = None
+    command: str | None = None
+    available: Callable[[ExoyOneSnapshot], bool] = _always
+    options: Callable[[ExoyOneDataUpdateCoordinator], Sequence[str]] | None = None
+    depends_on: frozenset[str] | None = None
+
+    @property
+    def state_fields(self) -> frozenset[str]:
+        """Return the state fields the attribute is derived from."""
+        return self.depends_on or frozenset({self.key})
+
+    @property
+    def command_key(self) -> str:
+        """Return the command queue key that writes collapse under."""
+        return self.command or self.key
+
+
+def _field(key: str) -> Callable[[ExoyOneDataUpdateCoordinator], Any]:
+    """Return a reader for a plain state field."""
+    return lambda coordinator: coordinator.data[key]
+
+
+def _toggle(
+    key: str,
+) -> Callable[[ExoyOneDataUpdateCoordinator, Any], tuple[dict[str, Any], Any]]:
+    """Return a writer for a field switched with "on" or "off"."""
+    return lambda _coordinator, on: ({key: bool(on)}, "on" if on else "off")
+
+
+def _read_speed(coordinator: ExoyOneDataUpdateCoordinator) -> int:
+    """Return the effect speed in percent."""
+    return coordinator.data.derive("speed", lambda data: int(data.speed / 255 * 100))
+
+
+def _write_speed(
+    _coordinator: ExoyOneDataUpdateCoordinator, percent: float
+) -> tuple[dict[str, Any], Any]:
+    """Convert a speed in percent to the device scale."""
+    speed = int(percent / 100 * 255)
+    return {"speed": speed}, speed
+
+
+def _read_shutdown_timer(coordinator: ExoyOneDataUpdateCoordinator) -> int:
+    """Return the minutes left on the locally counted down shutdown timer."""
+    remaining = coordinator.async_timer_remaining()
+    if remaining is None:
+        remaining = coordinator.data.shutdownTimer
+    return math.ceil(remaining / 60)
+
+
+def _write_shutdown_timer(
+    _coordinator: ExoyOneDataUpdateCoordinator, minutes: float
+) -> tuple[dict[str, Any], Any]:
+    """Set the timer in minutes; the device reports it in seconds."""
+    return {"shutdownTimer": int(minutes * 60)}, minutes or 0
+
+
+def _read_pack_name(coordinator: ExoyOneDataUpdateCoordinator) -> str | None:
+    """Return the name of the current mode pack."""
+    return coordinator.data.derive(
+        "pack_name", lambda data: coordinator.modes.pack_name(data.currentModpack)
+    )
+
+
+def _read_effect_name(coordinator: ExoyOneDataUpdateCoordinator) -> str | None:
+    """Return the name of the current effect."""
+    return coordinator.data.derive(
+        "effect_name",
+        lambda data: coordinator.modes.effect_name(data.currentModpack, data.modeIndex),
+    )
+
+
+def _write_pack(
+    coordinator: ExoyOneDataUpdateCoordinator, option: str
+) -> tuple[dict[str, Any], Any]:
+    """Switch mode packs, keeping the effect index if the new pack has it."""
+    pi = coordinator.modes.pack_indices[option]
+    ei = coordinator.data.modeIndex
+    if ei >= len(coordinator.modes.effect_options(pi)):
+        ei = 0
+    return {"currentModpack": pi, "modeIndex": ei}, (pi, ei)
+
+
+def _write_effect(
+    coordinator: ExoyOneDataUpdateCoordinator, option: str
+) -> tuple[dict[str, Any], Any]:
+    """Select an effect by name."""
+    pi, ei = coordinator.modes.effect_indices[option]
+    return {"currentModpack": pi, "modeIndex": ei}, (pi, ei)
+
+
+ATTRIBUTES: dict[str, ExoyOneAttribute] = {
+    attribute.key: attribute
+    for attribute in (
+        ExoyOneAttribute(
+            key="musicSync",
+            read=lambda coordinator: (
+                True if coordinator.data.forceMusicSync else coordinator.data.musicSync
+            ),
+            method="toggle_music_sync",
+            write=_toggle("musicSync"),
+            available=lambda data: not data.forceMusicSync or data.sceneGeneration,
+            depends_on=frozenset({"musicSync", "forceMusicSync", "sceneGeneration"}),
+        ),
+        ExoyOneAttribute(
+            key="autoChange",
+            read=_field("autoChange"),
+            method="toggle_mode_cycle",
+            write=_toggle("autoChange"),
+            available=lambda data: not data.sceneGeneration,
+            depends_on=frozenset({"autoChange", "sceneGeneration"}),
+        ),
+        ExoyOneAttribute(
+            key="sceneGeneration",
+            read=_field("sceneGeneration"),
+            method="toggle_scene_generation",
+            write=_toggle("sceneGeneration"),
+        ),
+        ExoyOneAttribute(
+            key="poweredByPowerbank",
+            read=_field("poweredByPowerbank"),
+            method="powered_by_powerbank",
+            write=_toggle("poweredByPowerbank"),
+        ),
+        ExoyOneAttribute(
+            key="direction",
+            read=_field("direction"),
+            method="toggle_direction",
+            write=_toggle("direction"),
+        ),
+        ExoyOneAttribute(key="forceMusicSync", read=_field("forceMusicSync")),
+        ExoyOneAttribute(key="lockColorWheel", read=_field("lockColorWheel")),
+        ExoyOneAttribute(
+            key="speed",
+            read=_read_speed,
+            method="set_speed",
+            write=_write_speed,
+        ),
+        ExoyOneAttribute(
+            key="cycleSpeed",
+            read=_field("cycleSpeed"),
+            method="set_cycle_speed",
+            write=lambda _coordinator, seconds: ({"cycleSpeed": seconds}, seconds),
+        ),
+        ExoyOneAttribute(
+            key="shutdownTimer",
+            read=_read_shutdown_timer,
+            method="set_shutdown_timer",
+            write=_write_shutdown_timer,
+        ),
+        ExoyOneAttribute(
+            key="currentModpack",
+            read=_read_pack_name,
+            method="set_effect",
+            write=_write_pack,
+            command="effect",
+            options=lambda coordinator: coordinator.modes.packs,
+        ),
+        ExoyOneAttribute(
+            key="modeIndex",
+            read=_read_effect_name,
+            method="set_effect",
+            write=_write_effect,
+            command="effect",
+            options=lambda coordinator: coordinator.modes.effect_options(
+                coordinator.data.currentModpack
+            ),
+            depends_on=frozenset({"currentModpack", "modeIndex"}),
+        ),
+    )
+}
+
+
+def bind_attributes(client: ExoyOne) -> dict[str, Callable[[Any], Awaitable[Any]]]:
+    """Return the device method of every writable attribute, bound to a client."""
+    return {
+        key: getattr(client, attribute.method)
+        for key, attribute in ATTRIBUTES.items()
+        if attribute.method is not None
+    }
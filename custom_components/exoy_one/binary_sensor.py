@@ -67,11 +67,11 @@ class ExoyOneBinarySensor(ExoyOneEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self.entity_description = entity_description
         self._attr_name = entity_description.name
-        mdns_name = self.coordinator.exoyone.state.mdnsName
+        mdns_name = self.coordinator.device.mdns_name
         self.entity_id = f"binary_sensor.{mdns_name}_{entity_description.key}"
         self._attr_unique_id = f"{mdns_name}_binary_sensor_{entity_description.key}"
 
     @property
     def is_on(self) -> bool:
         """Return false if the corresponding ExoyOne state is true."""
-        return not self.coordinator.async_is_on(self.entity_description.key)
+        return not self.coordinator.async_read(self.entity_description.key)
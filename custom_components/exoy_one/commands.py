@@ -0,0 +1,77 @@
+"""Per-device command queue for ExoyONE."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Lower values are sent first.
+PRIORITY_POWER_OFF = 0
+PRIORITY_COMMAND = 1
+PRIORITY_POLL = 2
+
+
+class ExoyOneCommandQueue:
+    """Send the calls to one device one at a time."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future[bool]]] = []
+        self._queued: dict[str, asyncio.Future[bool]] = {}
+        self._counter = itertools.count()
+        self.collapsed = 0
+
+    async def async_run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        *,
+        priority: int = PRIORITY_COMMAND,
+    ) -> bool:
+        """Queue a call; return False if a newer call to the same key replaced it."""
+        if not await self._async_acquire(key, priority):
+            return False
+        try:
+            await call()
+        finally:
+            self._async_release()
+        return True
+
+    async def _async_acquire(self, key: str, priority: int) -> bool:
+        """Wait for the device; a queued call to the same key is superseded."""
+        previous = self._queued.pop(key, None)
+        if previous is not None and not previous.done():
+            previous.set_result(False)
+            self.collapsed += 1
+
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queued[key] = waiter
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self._async_release()
+            raise
+        finally:
+            if self._queued.get(key) is waiter:
+                del self._queued[key]
+
+    def _async_release(self) -> None:
+        """Hand the device to the most urgent queued call or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(True)
+                return
+        self._busy = False
@@ -6,16 +6,33 @@ import socket
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
-from exoyone import ExoyOne, ExoyOneTimeoutError
+from exoyone import ExoyOneTimeoutError
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.const import CONF_HOST, CONF_IP_ADDRESS
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_IP_ADDRESS, CONF_SCAN_INTERVAL
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import DOMAIN, LOGGER
+from .commands import PRIORITY_POLL
+from .connection import async_get_connection_manager
+from .const import (
+    CONF_TRACE,
+    DEFAULT_IDLE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    MAX_IDLE_INTERVAL,
+    MIN_IDLE_INTERVAL,
+    TRACE_OFF,
+    TRACE_SINKS,
+)
 
 if TYPE_CHECKING:
+    from exoyone import ExoyOne
     from homeassistant.components.zeroconf import ZeroconfServiceInfo
-    from homeassistant.config_entries import ConfigFlowResult
+    from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
 
 
 class ExoyOneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -27,6 +44,14 @@ class ExoyOneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovered_device: ExoyOne | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,  # noqa: ARG004
+    ) -> ExoyOneOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return ExoyOneOptionsFlowHandler()
+
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
     ) -> ConfigFlowResult:
@@ -52,15 +77,34 @@ class ExoyOneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             ):
                 return self.async_abort(reason="already_in_progress")
 
-        if not (device := await _async_try_connect(ip_address)):
+        # Skip the probe for a device that recently answered at this address
+        # and is still configured with it. Ignored entries have no host.
+        connections = async_get_connection_manager(self.hass)
+        if (
+            (mdns_name := connections.async_cached_probe(hostname, ip_address))
+            and (
+                entry := self.hass.config_entries.async_entry_for_domain_unique_id(
+                    DOMAIN, mdns_name
+                )
+            )
+            and entry.data.get(CONF_HOST) == ip_address
+        ):
+            return self.async_abort(reason="already_configured")
+
+        if not (device := await _async_try_connect(self.hass, ip_address)):
             LOGGER.debug("Failed to connect to %s (%s)", hostname, ip_address)
             return self.async_abort(reason="cannot_connect")
 
         if device is not None:
             self._discovered_device: ExoyOne = device
+            connections.async_record_probe(hostname, ip_address, device.state.mdnsName)
 
         await self.async_set_unique_id(self._discovered_device.state.mdnsName)
-        self._abort_if_unique_id_configured(updates={CONF_HOST: ip_address})
+        # The update listener rebinds a loaded entry to the new address in
+        # place, so there is no need for a full reload.
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: ip_address}, reload_on_update=False
+        )
 
         return await self.async_step_discovery_confirm(
             {
@@ -115,13 +159,75 @@ class ExoyOneFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
-async def _async_try_connect(ip_address: str) -> ExoyOne | None:
+class ExoyOneOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for ExoyONE."""
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> ConfigFlowResult:
+        """Manage the polling and tracing options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_IDLE_INTERVAL
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=MIN_IDLE_INTERVAL,
+                            max=MAX_IDLE_INTERVAL,
+                            step=1,
+                            unit_of_measurement="s",
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_TRACE,
+                        default=self.config_entry.options.get(CONF_TRACE, TRACE_OFF),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=TRACE_SINKS,
+                            translation_key=CONF_TRACE,
+                        ),
+                    ),
+                },
+            ),
+        )
+
+
+async def _async_try_connect(hass: HomeAssistant, ip_address: str) -> ExoyOne | None:
     """Try to connect to the ExoyONE."""
     try:
-        exoyone = ExoyOne(host=ip_address)
-        await exoyone.async_get_data()
+        if coordinator := _async_get_loaded_coordinator(hass, ip_address):
+            # Wait for the loaded entry's device queue rather than cutting in
+            # between its commands.
+            exoyone = coordinator.exoyone
+            await coordinator.commands.async_run(
+                "probe", exoyone.async_get_data, priority=PRIORITY_POLL
+            )
+        else:
+            exoyone = async_get_connection_manager(hass).async_get(ip_address)
+            await exoyone.async_get_data()
     except socket.gaierror:
         return None
     except ExoyOneTimeoutError as exception:
         raise data_entry_flow.AbortFlow(reason="cannot_connect") from exception
     return exoyone
+
+
+@callback
+def _async_get_loaded_coordinator(
+    hass: HomeAssistant, host: str
+) -> ExoyOneDataUpdateCoordinator | None:
+    """Return the coordinator of the loaded entry talking to a host, if any."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is ConfigEntryState.LOADED and entry.runtime_data.host == host:
+            return entry.runtime_data.coordinator
+    return None
@@ -0,0 +1,93 @@
+"""Domain-wide connection manager for ExoyONE devices."""
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from exoyone import ExoyOne
+from homeassistant.core import callback
+
+from .const import DATA_CONNECTIONS, IDLE_CLIENT_TTL, PROBE_CACHE_TTL
+
+if TYPE_CHECKING:
+    from asyncio import TimerHandle
+
+    from homeassistant.core import HomeAssistant
+
+
+class ExoyOneConnectionManager:
+    """Own one long-lived ExoyOne client per device host."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._clients: dict[str, ExoyOne] = {}
+        self._refs: dict[str, int] = {}
+        self._expiry: dict[str, TimerHandle] = {}
+        self._probes: dict[tuple[str, str], tuple[str, float]] = {}
+
+    @callback
+    def async_get(self, host: str) -> ExoyOne:
+        """Return the client for a host, creating it if needed."""
+        if (client := self._clients.get(host)) is None:
+            client = self._clients[host] = ExoyOne(host=host)
+            self._async_schedule_expiry(host)
+        return client
+
+    @callback
+    def async_acquire(self, host: str) -> ExoyOne:
+        """Return the client for a host and keep it alive until released."""
+        client = self.async_get(host)
+        self._refs[host] = self._refs.get(host, 0) + 1
+        if handle := self._expiry.pop(host, None):
+            handle.cancel()
+        return client
+
+    @callback
+    def async_release(self, host: str) -> None:
+        """Release a client acquired with async_acquire."""
+        self._refs[host] -= 1
+        if not self._refs[host]:
+            del self._refs[host]
+            self._async_schedule_expiry(host)
+
+    @callback
+    def async_cached_probe(self, hostname: str, host: str) -> str | None:
+        """Return the mdnsName a recent probe of hostname at host found."""
+        if (probe := self._probes.get((hostname, host))) is None:
+            return None
+        mdns_name, expires = probe
+        if expires < monotonic():
+            del self._probes[(hostname, host)]
+            return None
+        return mdns_name
+
+    @callback
+    def async_record_probe(self, hostname: str, host: str, mdns_name: str) -> None:
+        """Remember which device answered a discovery probe."""
+        self._probes[(hostname, host)] = (mdns_name, monotonic() + PROBE_CACHE_TTL)
+
+    @callback
+    def _async_schedule_expiry(self, host: str) -> None:
+        """Drop an unused client unless someone acquires it in time."""
+        if handle := self._expiry.pop(host, None):
+            handle.cancel()
+        self._expiry[host] = self._hass.loop.call_later(
+            IDLE_CLIENT_TTL, self._async_expire, host
+        )
+
+    @callback
+    def _async_expire(self, host: str) -> None:
+        """Drop the client of a host that is no longer used."""
+        self._expiry.pop(host, None)
+        if host not in self._refs:
+            self._clients.pop(host, None)
+
+
+@callback
+def async_get_connection_manager(hass: HomeAssistant) -> ExoyOneConnectionManager:
+    """Return the connection manager shared by config flows and entries."""
+    if DATA_CONNECTIONS not in hass.data:
+        hass.data[DATA_CONNECTIONS] = ExoyOneConnectionManager(hass)
+    return hass.data[DATA_CONNECTIONS]
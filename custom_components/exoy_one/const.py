@@ -1,5 +1,6 @@
 """Constants for exoyone."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
@@ -7,3 +8,111 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "exoy_one"
 
 ATTR_STATE = "state"
+
+# Adaptive polling: poll quickly for a short while after any command or
+# observed state change, then back off step by step to the idle interval.
+FAST_UPDATE_INTERVAL = timedelta(milliseconds=500)
+ACTIVITY_WINDOW = timedelta(seconds=10)
+DEFAULT_IDLE_INTERVAL = 15
+MIN_IDLE_INTERVAL = 3
+MAX_IDLE_INTERVAL = 300
+
+# While the device pushes its state changes, polls only check that it is alive.
+PUSH_LIVENESS_INTERVAL = timedelta(minutes=1)
+
+# A polled shutdown timer this close to the local countdown (seconds) only
+# corrects drift and is not reported as a change.
+SHUTDOWN_TIMER_DRIFT = 5
+
+# Unreachable devices are retried with exponential backoff up to this interval.
+MAX_RECONNECT_INTERVAL = timedelta(minutes=5)
+
+# ExoyOneState fields that reflect the live device state. Identity fields such
+# as mdnsName or firmwareVersion are deliberately left out.
+STATE_FIELDS = (
+    "fadingOff",
+    "brightness",
+    "hue",
+    "saturation",
+    "lockColorWheel",
+    "currentModpack",
+    "modeIndex",
+    "musicSync",
+    "forceMusicSync",
+    "sceneGeneration",
+    "autoChange",
+    "poweredByPowerbank",
+    "direction",
+    "speed",
+    "cycleSpeed",
+    "shutdownTimer",
+)
+
+# ExoyOneState fields entities outside the attribute table in attributes.py
+# read, keyed by entity description key.
+STATE_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "exoyone": frozenset(
+        {
+            "fadingOff",
+            "brightness",
+            "hue",
+            "saturation",
+            "lockColorWheel",
+            "currentModpack",
+            "modeIndex",
+        }
+    ),
+}
+
+# Domain-wide poll scheduling shared by all config entries.
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+MAX_CONCURRENT_POLLS = 4
+
+# Clients nobody holds on to are kept this long so that reloads and config
+# flows can reuse them.
+DATA_CONNECTIONS = f"{DOMAIN}_connections"
+IDLE_CLIENT_TTL = 300
+
+# The mode pack catalog is indexed once and shared by all config entries.
+DATA_MODE_PACK_INDEX = f"{DOMAIN}_mode_pack_index"
+
+# Discovery probe results are trusted for this long before probing again.
+PROBE_CACHE_TTL = 900
+
+# Last known device state, used to create entities before the first poll.
+STORAGE_VERSION = 1
+STATE_CACHE_SAVE_DELAY = 60
+
+# Number of recent round trips kept for the latency percentiles.
+STATISTICS_WINDOW = 500
+
+# Device calls time out after the p99 round trip times this factor, within
+# these bounds (seconds). The ceiling applies until enough samples exist.
+TIMEOUT_RTT_FACTOR = 3
+MIN_TIMEOUT = 0.5
+MAX_TIMEOUT = 5.0
+MIN_TIMEOUT_SAMPLES = 20
+
+# A failed poll keeps the last good state for this long before the entities
+# become unavailable.
+POLL_GRACE_PERIOD = timedelta(seconds=20)
+
+# Opt-in tracing of device calls and entity state writes.
+CONF_TRACE = "trace"
+TRACE_OFF = "off"
+TRACE_LOGGER = "logger"
+TRACE_BUFFER = "buffer"
+TRACE_OPENTELEMETRY = "opentelemetry"
+TRACE_SINKS = [TRACE_OFF, TRACE_LOGGER, TRACE_BUFFER, TRACE_OPENTELEMETRY]
+TRACE_BUFFER_SIZE = 1000
+
+# Devices a scene sends commands to at the same time.
+MAX_CONCURRENT_SCENE_COMMANDS = 32
+
+# Transitions are driven by one shared ticker at most this many frames per
+# second; a device still busy with the previous frame skips a tick.
+DATA_TRANSITIONS = f"{DOMAIN}_transitions"
+TRANSITION_FPS = 10
+
+# Number of recent streamed frames the achieved frame rate is computed over.
+STREAM_FPS_WINDOW = 50
@@ -2,36 +2,101 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import asdict
 from datetime import timedelta
+from functools import partial
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
-from exoyone import ExoyOneException, ExoyOneTimeoutError, mode_packs
+from exoyone import ExoyOneException, ExoyOneTimeoutError
+from homeassistant.core import callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, LOGGER
-from .utils import get_method_for_attribute
+from .attributes import ATTRIBUTES, bind_attributes
+from .commands import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_POWER_OFF,
+    ExoyOneCommandQueue,
+)
+from .const import (
+    ACTIVITY_WINDOW,
+    DOMAIN,
+    FAST_UPDATE_INTERVAL,
+    LOGGER,
+    MAX_RECONNECT_INTERVAL,
+    POLL_GRACE_PERIOD,
+    PUSH_LIVENESS_INTERVAL,
+    SHUTDOWN_TIMER_DRIFT,
+    STATE_CACHE_SAVE_DELAY,
+    STATE_FIELDS,
+)
+from .data import ExoyOneDevice
+from .modes import async_get_mode_pack_index
+from .push import ExoyOnePushListener
+from .snapshot import ExoyOneSnapshot
+from .stats import ExoyOneStatistics
+from .stream import ExoyOneColorStream
+from .transitions import async_get_transition_scheduler
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+    from datetime import datetime
+
     from exoyone import ExoyOne, ExoyOneState
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
 
     from .data import ExoyOneConfigEntry
+    from .scheduler import ExoyOnePollScheduler
+    from .tracing import Tracer
 
 
-class ExoyOneDataUpdateCoordinator(DataUpdateCoordinator):
+class ExoyOneDataUpdateCoordinator(DataUpdateCoordinator[ExoyOneSnapshot]):
     """Class to manage fetching data from the Exoy ONE."""
 
     config_entry: ExoyOneConfigEntry
+    device: ExoyOneDevice
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        idle_interval: timedelta,
+        scheduler: ExoyOnePollScheduler,
+        store: Store[dict[str, Any]],
+        tracer: Tracer,
+    ) -> None:
         """Initialize."""
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=3),
+            update_interval=idle_interval,
+            always_update=False,
         )
-        self.mp = mode_packs
+        self.modes = async_get_mode_pack_index(hass)
+        self._transitions = async_get_transition_scheduler(hass)
+        self.idle_interval = idle_interval
+        self._scheduler = scheduler
+        self._store = store
+        self._poll_interval = idle_interval
+        self._active_until = 0.0
+        self.changed_fields: frozenset[str] = frozenset(STATE_FIELDS)
+        self._sequence = 0
+        self._optimistic: dict[str, tuple[int, Any]] = {}
+        self._in_flight: set[int] = set()
+        self.commands = ExoyOneCommandQueue()
+        self.statistics = ExoyOneStatistics()
+        self.tracer = tracer
+        self.stream = ExoyOneColorStream(self)
+        self.push = ExoyOnePushListener(self)
+        self.push_connected = False
+        self._timer: tuple[float, float] | None = None
+        self._timer_tick: Callable[[], None] | None = None
+        self._methods: dict[str, Callable[[Any], Awaitable[Any]]] = {}
 
     @property
     def exoyone(self) -> ExoyOne:
@@ -43,98 +108,498 @@ class ExoyOneDataUpdateCoordinator(DataUpdateCoordinator):
         """Return the state."""
         return self.config_entry.runtime_data.exoyone.state
 
-    async def _async_update_data(self) -> Any:
+    @property
+    def dropped_writes(self) -> int:
+        """Return how many queued commands were replaced by newer ones."""
+        return self.commands.collapsed
+
+    @callback
+    def async_restore(self, cache: dict[str, Any]) -> bool:
+        """Restore the device and its last known state from the cache."""
+        if not set(STATE_FIELDS).issubset(cache.get("state", {})):
+            return False
+        self.device = ExoyOneDevice(**cache["device"])
+        self.data = ExoyOneSnapshot(1, cache["state"])
+        return True
+
+    @callback
+    def async_restore_device(self, device: ExoyOneDevice) -> None:
+        """Start out unavailable with a known device until it answers."""
+        self.device = device
+        self.data = ExoyOneSnapshot(1, dict.fromkeys(STATE_FIELDS))
+        self.last_update_success = False
+        # Retry from the fastest interval, as after a failed poll.
+        self._poll_interval = FAST_UPDATE_INTERVAL
+
+    @callback
+    def async_set_initial_data(self) -> None:
+        """Use the state the client fetched during setup as the first poll."""
+        self.device = ExoyOneDevice.from_client(self.exoyone)
+        self.async_set_updated_data(
+            ExoyOneSnapshot(
+                1, {field: getattr(self.state, field) for field in STATE_FIELDS}
+            )
+        )
+        self._async_anchor_timer(self.data.shutdownTimer)
+        self._async_schedule_save()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the shutdown timer countdown."""
+        if self._timer_tick is not None:
+            self._timer_tick()
+            self._timer_tick = None
+        await super().async_shutdown()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist the device and its state for the next warm start."""
+        self._store.async_delay_save(
+            lambda: {"device": asdict(self.device), "state": self.data.as_dict()},
+            STATE_CACHE_SAVE_DELAY,
+        )
+
+    async def _async_update_data(self) -> ExoyOneSnapshot:
         """Update data via library."""
+        sequence = self._async_next_sequence()
         try:
-            return await self.exoyone.async_get_state()
-        except ExoyOneTimeoutError as exception:
-            raise UpdateFailed(exception) from exception
-        except ExoyOneException as exception:
+            # Take a fleet-wide slot before the device, so a poll waiting for
+            # its slot does not keep the commands of its device waiting too.
+            async with self._scheduler.async_poll_slot(
+                priority=monotonic() < self._active_until
+            ):
+                # Polls only reach the device in the gaps between commands.
+                polled = await self.commands.async_run(
+                    "poll", self._async_poll_device, priority=PRIORITY_POLL
+                )
+        except (ExoyOneTimeoutError, ExoyOneException) as exception:
+            self.statistics.record_failure(
+                timeout=isinstance(exception, ExoyOneTimeoutError)
+            )
+            self._async_back_off_update_interval()
+            if self._async_in_grace_period():
+                # Keep the last good state through a short hiccup.
+                LOGGER.debug(
+                    "Keeping the last state of %s: %s",
+                    self.config_entry.title,
+                    exception,
+                )
+                return self.data
             raise UpdateFailed(exception) from exception
 
-    def async_is_on(self, key: str) -> bool:
-        """Return True if the key is on."""
-        if key == "musicSync":
-            return True if self.state.forceMusicSync else self.state.musicSync
+        if not polled:
+            # A newer poll replaced this one and brings the state instead.
+            return self.data
 
-        return getattr(self.state, key)
+        self._async_refresh_device()
+        return self._async_process_state(self.state, sequence)
 
-    def async_is_available(self, key: str) -> bool:
-        """Return true if the key is available."""
-        if key == "musicSync":
-            return not self.state.forceMusicSync or self.state.sceneGeneration
+    @callback
+    def _async_refresh_device(self) -> None:
+        """Update a cached or registered device identity from the live state."""
+        device = ExoyOneDevice.from_client(self.exoyone)
+        if device == self.device:
+            return
+        registry = dr.async_get(self.hass)
+        if device_entry := registry.async_get_device(
+            identifiers={(DOMAIN, self.device.mdns_name)}
+        ):
+            registry.async_update_device(
+                device_entry.id,
+                name=device.name,
+                model_id=device.model_id,
+                sw_version=device.firmware_version,
+            )
+        self.device = device
+        self._async_schedule_save()
 
-        if key == "autoChange":
-            return not self.state.sceneGeneration
+    @callback
+    def async_handle_push(self, state: ExoyOneState) -> None:
+        """Apply a state the device pushed on its own."""
+        self.statistics.record_push()
+        if not self.push_connected:
+            self.push_connected = True
+            LOGGER.debug("Receiving pushed updates from %s", self.config_entry.title)
+        data = self._async_process_state(state, self._async_next_sequence())
+        if self.changed_fields:
+            self.async_set_updated_data(data)
+        else:
+            self._schedule_refresh()
 
-        return True
+    @callback
+    def async_push_disconnected(self) -> None:
+        """Fall back to polling until pushed updates resume."""
+        if not self.push_connected:
+            return
+        self.push_connected = False
+        LOGGER.debug("Lost pushed updates from %s", self.config_entry.title)
+        self.async_mark_active()
 
-    def async_get_sensor_value(self, key: str) -> str | int | None:
-        """Return the value of the sensor."""
-        if key == "currentModpack":
-            return self.mp.get_pack_name_from_index(self.state.currentModpack)
-        if key == "modeIndex":
-            return self.mp.get_effect_name_from_index(
-                self.state.currentModpack, self.state.modeIndex
+    def _async_process_state(
+        self, state: ExoyOneState, sequence: int
+    ) -> ExoyOneSnapshot:
+        """Return the snapshot for a state read from the device."""
+        data = {field: getattr(state, field) for field in STATE_FIELDS}
+
+        # Commands still in flight or acknowledged after this state was
+        # requested may not be reflected in it yet, so their optimistic values
+        # win until a newer state arrives.
+        self._optimistic = {
+            field: (command_sequence, value)
+            for field, (command_sequence, value) in self._optimistic.items()
+            if command_sequence > sequence or command_sequence in self._in_flight
+        }
+        for field, (_, value) in self._optimistic.items():
+            data[field] = value
+
+        remaining = self.async_timer_remaining()
+        self._async_anchor_timer(data["shutdownTimer"])
+
+        if self.data is None or not self.last_update_success:
+            self.changed_fields = frozenset(STATE_FIELDS)
+        else:
+            self.changed_fields = frozenset(
+                field for field in STATE_FIELDS if data[field] != self.data[field]
+            )
+            if (
+                remaining is not None
+                and abs(data["shutdownTimer"] - remaining) <= SHUTDOWN_TIMER_DRIFT
+            ):
+                # The device counts down by itself; this only corrects drift.
+                self.changed_fields -= {"shutdownTimer"}
+            if self.changed_fields:
+                self._active_until = monotonic() + ACTIVITY_WINDOW.total_seconds()
+        if self.changed_fields:
+            self._async_schedule_save()
+        self._async_adapt_update_interval()
+        if not self.changed_fields and self.data is not None:
+            return self.data
+        version = 1 if self.data is None else self.data.version + 1
+        return ExoyOneSnapshot(version, data)
+
+    async def _async_poll_device(self) -> None:
+        """Fetch the state from the device, retrying once on a timeout."""
+        try:
+            await self._async_poll_device_once()
+        except ExoyOneTimeoutError:
+            LOGGER.debug("Poll of %s timed out, retrying", self.config_entry.title)
+            self.statistics.record_failure(timeout=True)
+            await self._async_poll_device_once()
+
+    async def _async_poll_device_once(self) -> None:
+        """Fetch the state from the device."""
+        start = monotonic()
+        with self.tracer.span("poll"):
+            await _async_with_timeout(
+                self.exoyone.async_get_state(), self.statistics.polls.timeout()
             )
-        if key == "speed":
-            return int(self.state.speed / 255 * 100)
+        self.statistics.record_poll(monotonic() - start)
+
+    def _async_in_grace_period(self) -> bool:
+        """Return True if the last good state is recent enough to keep."""
+        since = self.statistics.seconds_since_success
+        return (
+            self.last_update_success
+            and since is not None
+            and since < POLL_GRACE_PERIOD.total_seconds()
+        )
+
+    def _async_next_sequence(self) -> int:
+        """Return the sequence number for the next poll or command."""
+        self._sequence += 1
+        return self._sequence
 
-        if key == "shutdownTimer":
-            return int(self.state.shutdownTimer / 60)
+    async def _async_send_command(
+        self,
+        values: dict[str, Any],
+        calls: dict[str, Callable[[], Awaitable[Any]]],
+        *,
+        priority: int = PRIORITY_COMMAND,
+    ) -> None:
+        """Show the commanded values right away, then queue the calls."""
+        # Any new command stops a running transition where it is.
+        self._transitions.async_cancel(self.config_entry.entry_id)
+        previous = {field: self.data[field] for field in values}
+        sequence = self._async_apply_optimistic(values)
+        self._in_flight.add(sequence)
+
+        try:
+            await asyncio.gather(
+                *(
+                    self.commands.async_run(
+                        key,
+                        partial(self._async_call_device, key, call),
+                        priority=priority,
+                    )
+                    for key, call in calls.items()
+                )
+            )
+        except Exception:
+            reverted = {
+                field: value
+                for field, value in previous.items()
+                if self._optimistic.get(field, (None,))[0] == sequence
+            }
+            for field in reverted:
+                del self._optimistic[field]
+            self._async_set_fields(reverted)
+            raise
+        finally:
+            self._in_flight.discard(sequence)
 
-        if key == "cycleSpeed":
-            return self.state.cycleSpeed
+        # Polls issued while the command was in flight may still see the old
+        # values, so only polls issued from now on may override them.
+        acknowledged = self._async_next_sequence()
+        for field, value in values.items():
+            if self._optimistic.get(field, (None,))[0] == sequence:
+                self._optimistic[field] = (acknowledged, value)
+        self.async_mark_active()
 
-        return None
+    async def _async_call_device(
+        self, key: str, call: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Send one command to the device."""
+        start = monotonic()
+        try:
+            with self.tracer.span("command", key):
+                await _async_with_timeout(call(), self.statistics.commands.timeout())
+        except Exception as exception:
+            self.statistics.record_failure(
+                timeout=isinstance(exception, ExoyOneTimeoutError)
+            )
+            raise
+        self.statistics.record_command(monotonic() - start)
 
-    async def async_set_value(self, key: str, value: float) -> None:
-        """Set a new value for the specified key."""
-        if key == "speed":
-            value = int(value / 100 * 255)
+    def _async_apply_optimistic(self, values: dict[str, Any]) -> int:
+        """Overlay commanded values on the current data until a poll confirms."""
+        sequence = self._async_next_sequence()
+        self._optimistic.update(
+            {field: (sequence, value) for field, value in values.items()}
+        )
+        self._async_set_fields(values)
+        return sequence
 
-        method = getattr(self.exoyone, get_method_for_attribute(key))
-        await method(value)
+    def _async_set_fields(self, values: dict[str, Any]) -> None:
+        """Update some fields of the current data and notify the entities."""
+        if not values:
+            return
+        self.data = self.data.replace(**values)
+        if "shutdownTimer" in values:
+            self._async_anchor_timer(values["shutdownTimer"])
+        self.changed_fields = frozenset(values)
+        self.async_update_listeners()
 
-    async def async_turn_on(self, key: str) -> None:
-        """Turn on the switch."""
-        method = getattr(self.exoyone, get_method_for_attribute(key))
-        await method("on")
+    @callback
+    def _async_anchor_timer(self, seconds: float | None) -> None:
+        """Count the shutdown timer down locally from a value just read or set."""
+        self._timer = None if seconds is None else (seconds, monotonic())
+        self._async_schedule_timer_tick()
 
-    async def async_turn_off(self, key: str) -> None:
-        """Turn off the switch."""
-        if key == "shutdownTimer":
-            return await self.exoyone.set_shutdown_timer(0)
+    def async_timer_remaining(self) -> float | None:
+        """Return the seconds left on the shutdown timer."""
+        if self._timer is None:
+            return None
+        seconds, anchor = self._timer
+        return max(0.0, seconds - (monotonic() - anchor))
 
-        method = getattr(self.exoyone, get_method_for_attribute(key))
-        return await method("off")
+    @callback
+    def _async_timer_tick(self, _now: datetime) -> None:
+        """Show the next minute of the shutdown timer countdown."""
+        self._timer_tick = None
+        self.changed_fields = frozenset({"shutdownTimer"})
+        self.async_update_listeners()
+        self._async_schedule_timer_tick()
 
-    def async_current_option(self, key: str) -> str:
-        """Return the current selected option."""
-        if key == "currentModpack":
-            return self.mp.get_pack_name_from_index(self.state.currentModpack)
-        if key == "modeIndex":
-            return self.mp.get_effect_name_from_index(
-                self.state.currentModpack, self.state.modeIndex
+    @callback
+    def _async_schedule_timer_tick(self) -> None:
+        """Wake up just after the displayed minute of the countdown changes."""
+        if self._timer_tick is not None:
+            self._timer_tick()
+            self._timer_tick = None
+        if remaining := self.async_timer_remaining():
+            # The minutes are rounded up, so they change on each whole minute.
+            self._timer_tick = async_call_later(
+                self.hass, (remaining % 60 or 60) + 0.01, self._async_timer_tick
             )
-        return ""
-
-    def async_all_options(self, key: str) -> list[str]:
-        """Return the list of available options."""
-        if key == "currentModpack":
-            return self.mp.mode_packs
-        if key == "modeIndex":
-            return self.mp.get_effects_by_index(self.state.currentModpack)
-        return []
-
-    async def async_select_option(self, key: str, option: str) -> None:
-        """Select the option."""
-        if key == "currentModpack":
-            pi = self.mp.get_pack_index_from_name(option)
-            if self.state.modeIndex <= len(self.mp.get_effects_by_index(pi)):
-                await self.exoyone.set_effect((pi, self.state.modeIndex))
-            else:
-                await self.exoyone.set_effect((pi, 0))
-        if key == "modeIndex":
-            pi, ei = self.mp.get_indices_from_effect_name(option)
-            await self.exoyone.set_effect((pi, ei))
+
+    def async_mark_active(self) -> None:
+        """Switch to fast polling after a command was sent to the device."""
+        self._active_until = monotonic() + ACTIVITY_WINDOW.total_seconds()
+        if self.push_connected:
+            return
+        if self.update_interval != FAST_UPDATE_INTERVAL:
+            self.update_interval = FAST_UPDATE_INTERVAL
+            self._schedule_refresh()
+
+    @callback
+    def async_set_idle_interval(self, idle_interval: timedelta) -> None:
+        """Apply a new idle interval without reloading the entry."""
+        self.idle_interval = idle_interval
+        if self._poll_interval > idle_interval and self.last_update_success:
+            self._poll_interval = self.update_interval = idle_interval
+            self._schedule_refresh()
+
+    def _async_back_off_update_interval(self) -> None:
+        """Retry an unreachable device with exponential backoff."""
+        if self.last_update_success:
+            self._poll_interval = FAST_UPDATE_INTERVAL
+        self._poll_interval = min(self._poll_interval * 2, MAX_RECONNECT_INTERVAL)
+        self.update_interval = self._poll_interval
+
+    def _async_adapt_update_interval(self) -> None:
+        """Poll fast while active, then back off step by step until idle."""
+        if self.push_connected:
+            # Pushed updates keep the state current; polls only check liveness.
+            self._poll_interval = self.update_interval = PUSH_LIVENESS_INTERVAL
+            return
+
+        if monotonic() < self._active_until:
+            self._poll_interval = self.update_interval = FAST_UPDATE_INTERVAL
+            return
+
+        # Quiet devices poll in their own phase so they never run in lockstep.
+        self._poll_interval = min(self._poll_interval * 2, self.idle_interval)
+        self.update_interval = timedelta(
+            seconds=self._scheduler.async_next_delay(
+                self.config_entry.entry_id, self._poll_interval.total_seconds()
+            )
+        )
+
+    @callback
+    def async_bind_client(self) -> None:
+        """Resolve the device method of every attribute for the current client."""
+        self._methods = bind_attributes(self.exoyone)
+
+    def async_read(self, key: str) -> Any:
+        """Return the value of an attribute."""
+        return ATTRIBUTES[key].read(self)
+
+    def async_is_available(self, key: str) -> bool:
+        """Return True if the attribute can currently be changed."""
+        return ATTRIBUTES[key].available(self.data)
+
+    def async_options(self, key: str) -> Sequence[str]:
+        """Return the options of a select attribute."""
+        return ATTRIBUTES[key].options(self)
+
+    async def async_write(self, key: str, value: Any) -> None:
+        """Write a new value of an attribute to the device."""
+        attribute = ATTRIBUTES[key]
+        values, argument = attribute.write(self, value)
+        # A newer value queued for the same command replaces this one unsent.
+        await self._async_send_command(
+            values, {attribute.command_key: partial(self._methods[key], argument)}
+        )
+
+    async def async_turn_on_light(
+        self,
+        effect: str | None = None,
+        hs_color: tuple[float, float] | None = None,
+        brightness: int | None = None,
+        transition: float | None = None,
+    ) -> None:
+        """Turn the light on using as few device calls as possible."""
+        data = self.data
+        values: dict[str, Any] = {}
+        calls: dict[str, Callable[[], Awaitable[Any]]] = {}
+
+        if effect is not None:
+            pi, ei = self.modes.effect_indices[effect]
+            if (pi, ei) != (data.currentModpack, data.modeIndex):
+                values.update(currentModpack=pi, modeIndex=ei)
+                calls["effect"] = partial(self.exoyone.set_effect, (pi, ei))
+
+        if hs_color is not None:
+            # The state keeps the hue on the device's 0-255 scale.
+            hue, saturation = hs_color
+            hs_color = (int((hue / 360) * 255), saturation)
+        color_values, color_calls = self._async_color_command(hs_color, brightness)
+        if transition and data.fadingOff and color_values:
+            # Fade to the new color, then send it as the final frame.
+            if calls:
+                await self._async_send_command(values, calls)
+            if not await self._transitions.async_run(self, color_values, transition):
+                return
+            values, calls = {}, {}
+        values.update(color_values)
+        calls.update(color_calls)
+
+        if not data.fadingOff:
+            values.update(fadingOff=True)
+            calls["power"] = partial(self.exoyone.toggle_power, "on")
+
+        if calls:
+            await self._async_send_command(values, calls)
+
+    def _async_color_command(
+        self, hs_color: tuple[float, float] | None, brightness: int | None
+    ) -> tuple[dict[str, Any], dict[str, Callable[[], Awaitable[Any]]]]:
+        """Return the values and the call that set a new color or brightness."""
+        # The hue is on the device's 0-255 scale, like the hue in the state.
+        data = self.data
+        if brightness is None:
+            brightness = data.brightness
+
+        if hs_color is not None and (
+            tuple(hs_color) != (data.hue, data.saturation)
+            or brightness != data.brightness
+        ):
+            # set_color carries the brightness too, so one call covers both.
+            hue, saturation = hs_color
+            return (
+                {"hue": hue, "saturation": saturation, "brightness": brightness},
+                {
+                    "color": partial(
+                        self.exoyone.set_color, (hue, saturation, brightness)
+                    )
+                },
+            )
+        if brightness != data.brightness:
+            return (
+                {"brightness": brightness},
+                {"brightness": partial(self.exoyone.set_brightness, brightness)},
+            )
+        return {}, {}
+
+    async def async_send_frame(self, values: dict[str, float]) -> None:
+        """Send one transition frame; a frame that fails is skipped."""
+        hs_color = (
+            (int(values["hue"]), values["saturation"]) if "hue" in values else None
+        )
+        _, calls = self._async_color_command(hs_color, int(values["brightness"]))
+        for key, call in calls.items():
+            try:
+                await self.commands.async_run(
+                    key, partial(self._async_call_device, key, call)
+                )
+            except (ExoyOneTimeoutError, ExoyOneException) as exception:
+                LOGGER.debug(
+                    "Skipped a transition frame for %s: %s",
+                    self.config_entry.title,
+                    exception,
+                )
+
+    async def async_send_color_frame(self, color: tuple[int, float, int]) -> None:
+        """Send one streamed color frame without touching the state."""
+        self._transitions.async_cancel(self.config_entry.entry_id)
+        call = partial(self.exoyone.set_color, color)
+        await self.commands.async_run(
+            "color", partial(self._async_call_device, "color", call)
+        )
+
+    async def async_turn_off_light(self) -> None:
+        """Turn the light off."""
+        # Turning off goes ahead of any cosmetic change still queued.
+        await self._async_send_command(
+            {"fadingOff": False},
+            {"power": partial(self.exoyone.toggle_power, "off")},
+            priority=PRIORITY_POWER_OFF,
+        )
+
+
+async def _async_with_timeout(call: Awaitable[Any], seconds: float) -> Any:
+    """Await a device call, raising ExoyOneTimeoutError after some seconds."""
+    try:
+        async with asyncio.timeout(seconds):
+            return await call
+    except TimeoutError as exception:
+        raise ExoyOneTimeoutError from exception
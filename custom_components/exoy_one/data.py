@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Self
+
     from exoyone import ExoyOne
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
@@ -21,5 +23,27 @@ class ExoyOneData:
     """Data for the ExoyONE integration."""
 
     exoyone: ExoyOne
+    host: str
     coordinator: ExoyOneDataUpdateCoordinator
     integration: Integration
+
+
+@dataclass(frozen=True)
+class ExoyOneDevice:
+    """Identity of an Exoy ONE device."""
+
+    mdns_name: str
+    # The device registry may not know these for a device set up offline.
+    name: str | None
+    firmware_version: str | None
+    model_id: str | None
+
+    @classmethod
+    def from_client(cls, exoyone: ExoyOne) -> Self:
+        """Return the identity reported by a connected client."""
+        return cls(
+            mdns_name=exoyone.state.mdnsName,
+            name=exoyone.state.userDefinedName,
+            firmware_version=exoyone.state.firmwareVersion,
+            model_id=exoyone.device_type,
+        )
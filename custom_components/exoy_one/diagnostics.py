@@ -0,0 +1,39 @@
+"""Diagnostics support for ExoyONE."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import ExoyOneConfigEntry
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: ExoyOneConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "device": asdict(coordinator.device),
+        "state": coordinator.data.as_dict(),
+        "state_version": coordinator.data.version,
+        "polling": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "idle_interval": coordinator.idle_interval.total_seconds(),
+            "push_connected": coordinator.push_connected,
+        },
+        "dropped_writes": coordinator.dropped_writes,
+        "statistics": coordinator.statistics.as_dict(),
+        "stream": coordinator.stream.as_dict(),
+    }
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .attributes import ATTRIBUTES
+from .const import STATE_DEPENDENCIES
 from .coordinator import ExoyOneDataUpdateCoordinator
 
 if TYPE_CHECKING:
@@ -27,13 +30,32 @@ class ExoyOneEntity(CoordinatorEntity[ExoyOneDataUpdateCoordinator]):
             identifiers={
                 (
                     coordinator.config_entry.domain,
-                    coordinator.config_entry.runtime_data.exoyone.state.mdnsName,
+                    coordinator.device.mdns_name,
                 ),
             },
             manufacturer="Exoy BV",
-            name=coordinator.exoyone.state.userDefinedName,
+            name=coordinator.device.name,
             model="Exoy(tm) ONE",
-            model_id=coordinator.exoyone.device_type,
-            serial_number=coordinator.exoyone.state.mdnsName,
-            sw_version=coordinator.exoyone.state.firmwareVersion,
+            model_id=coordinator.device.model_id,
+            serial_number=coordinator.device.mdns_name,
+            sw_version=coordinator.device.firmware_version,
         )
+
+    @property
+    def state_fields(self) -> frozenset[str]:
+        """Return the ExoyOneState fields this entity depends on."""
+        key = self.entity_description.key
+        if (attribute := ATTRIBUTES.get(key)) is not None:
+            return attribute.state_fields
+        return STATE_DEPENDENCIES.get(key, frozenset({key}))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when a field this entity depends on has changed."""
+        if (
+            self.coordinator.last_update_success
+            and self.coordinator.changed_fields.isdisjoint(self.state_fields)
+        ):
+            return
+        with self.coordinator.tracer.span("write", self.entity_id):
+            super()._handle_coordinator_update()
@@ -7,7 +7,9 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
     ATTR_EFFECT,
+    ATTR_EFFECT_LIST,
     ATTR_HS_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
     LightEntityDescription,
@@ -50,6 +52,8 @@ class ExoyOneLight(ExoyOneEntity, LightEntity):
     """Exoy ONE light class."""
 
     _attr_has_entity_name = True
+    # The effect catalog never changes, so keep it out of the recorder.
+    _unrecorded_attributes = frozenset({ATTR_EFFECT_LIST})
 
     def __init__(
         self,
@@ -60,66 +64,56 @@ class ExoyOneLight(ExoyOneEntity, LightEntity):
         super().__init__(coordinator)
         self.entity_description = entity_description
 
-        self.entity_id = f"light.{self.coordinator.exoyone.state.mdnsName}_exoyOne"
-        self._attr_unique_id = f"{self.coordinator.exoyone.state.mdnsName}_light"
+        self.entity_id = f"light.{self.coordinator.device.mdns_name}_exoyOne"
+        self._attr_unique_id = f"{self.coordinator.device.mdns_name}_light"
         self._attr_color_mode = ColorMode.HS
         self._attr_name = None
         self._attr_supported_color_modes = {ColorMode.HS}
-        self._attr_supported_features = LightEntityFeature.EFFECT
-        self._attr_effect_list = self.coordinator.mp.effects
+        self._attr_supported_features = (
+            LightEntityFeature.EFFECT | LightEntityFeature.TRANSITION
+        )
+        self._attr_effect_list = self.coordinator.modes.effects
 
     @property
     def is_on(self) -> bool:
         """Return the state of the light."""
-        return self.coordinator.exoyone.state.fadingOff
+        return self.coordinator.data.fadingOff
 
     @property
     def brightness(self) -> int:
         """Return the brightness of the light."""
-        return self.coordinator.exoyone.state.brightness
+        return self.coordinator.data.brightness
 
     @property
     def hs_color(self) -> tuple[float, float]:
         """Return the hs color value."""
-        return (
-            self.coordinator.exoyone.state.hue,
-            self.coordinator.exoyone.state.saturation,
-        )
+        data = self.coordinator.data
+        # The device reports the hue on a 0-255 scale.
+        return (data.hue / 255 * 360, data.saturation)
 
     @property
     def color_mode(self) -> ColorMode:
         """Return current color mode."""
         return (
             ColorMode.BRIGHTNESS
-            if self.coordinator.state.lockColorWheel is True
+            if self.coordinator.data.lockColorWheel is True
             else ColorMode.HS
         )
 
     @property
-    def effect(self) -> str:
+    def effect(self) -> str | None:
         """Return the current effect."""
-        return self.coordinator.mp.get_effect_name_from_index(
-            self.coordinator.state.currentModpack, self.coordinator.state.modeIndex
-        )
+        return self.coordinator.async_read("modeIndex")
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        if ATTR_EFFECT in kwargs:
-            effect = kwargs[ATTR_EFFECT]
-            pi, ei = self.coordinator.mp.get_indices_from_effect_name(effect)
-            await self.coordinator.exoyone.set_effect((pi, ei))
-
-        if ATTR_HS_COLOR in kwargs:
-            hue, saturation = kwargs[ATTR_HS_COLOR]
-            hue = int((hue / 360) * 255)
-            await self.coordinator.exoyone.set_color((hue, saturation, self.brightness))
-
-        if ATTR_BRIGHTNESS in kwargs:
-            brightness = kwargs[ATTR_BRIGHTNESS]
-            await self.coordinator.exoyone.set_brightness(brightness)
-
-        await self.coordinator.exoyone.toggle_power("on")
+        await self.coordinator.async_turn_on_light(
+            effect=kwargs.get(ATTR_EFFECT),
+            hs_color=kwargs.get(ATTR_HS_COLOR),
+            brightness=kwargs.get(ATTR_BRIGHTNESS),
+            transition=kwargs.get(ATTR_TRANSITION),
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Turn the light off."""
-        await self.coordinator.exoyone.toggle_power("off")
+        await self.coordinator.async_turn_off_light()
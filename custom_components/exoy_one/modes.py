@@ -0,0 +1,81 @@
+"""Precomputed lookup tables for the Exoy ONE mode packs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from exoyone import mode_packs
+
+from .const import DATA_MODE_PACK_INDEX
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import ModuleType
+
+    from homeassistant.core import HomeAssistant
+
+
+@dataclass(frozen=True)
+class ModePackIndex:
+    """Immutable, bidirectional index of mode packs and their effects."""
+
+    packs: tuple[str, ...]
+    effects: tuple[str, ...]
+    pack_names: Mapping[int, str]
+    pack_effects: Mapping[int, tuple[str, ...]]
+    pack_indices: Mapping[str, int]
+    effect_names: Mapping[tuple[int, int], str]
+    effect_indices: Mapping[str, tuple[int, int]]
+
+    @classmethod
+    def from_mode_packs(cls, mp: ModuleType) -> ModePackIndex:
+        """Build the index from the exoyone.mode_packs catalog."""
+        packs = tuple(mp.mode_packs)
+        pack_effects = {
+            pi: tuple(mp.get_effects_by_index(pi)) for pi in range(len(packs))
+        }
+        # The index is shared by all config entries and its sequences are
+        # handed out to entities as is, so none of it may be mutable.
+        return cls(
+            packs=packs,
+            effects=tuple(mp.effects),
+            pack_names=MappingProxyType(dict(enumerate(packs))),
+            pack_effects=MappingProxyType(pack_effects),
+            pack_indices=MappingProxyType({name: pi for pi, name in enumerate(packs)}),
+            effect_names=MappingProxyType(
+                {
+                    (pi, ei): name
+                    for pi, effects in pack_effects.items()
+                    for ei, name in enumerate(effects)
+                }
+            ),
+            effect_indices=MappingProxyType(
+                {
+                    name: tuple(mp.get_indices_from_effect_name(name))
+                    for name in mp.effects
+                }
+            ),
+        )
+
+    def pack_name(self, pack_index: int | None) -> str | None:
+        """Return the name of the mode pack at the given index."""
+        return self.pack_names.get(pack_index)
+
+    def effect_name(
+        self, pack_index: int | None, effect_index: int | None
+    ) -> str | None:
+        """Return the name of the effect at the given indices."""
+        return self.effect_names.get((pack_index, effect_index))
+
+    def effect_options(self, pack_index: int | None) -> tuple[str, ...]:
+        """Return the effect names of the mode pack at the given index."""
+        return self.pack_effects.get(pack_index, ())
+
+
+def async_get_mode_pack_index(hass: HomeAssistant) -> ModePackIndex:
+    """Return the mode pack index shared by all config entries."""
+    if DATA_MODE_PACK_INDEX not in hass.data:
+        hass.data[DATA_MODE_PACK_INDEX] = ModePackIndex.from_mode_packs(mode_packs)
+    return hass.data[DATA_MODE_PACK_INDEX]
@@ -86,19 +86,17 @@ class ExoyOneNumber(ExoyOneEntity, NumberEntity):
         self.entity_description = entity_description
         self._attr_name = entity_description.name
         self._attr_unique_id = (
-            f"{self.coordinator.exoyone.state.mdnsName}_number_{entity_description.key}"
+            f"{self.coordinator.device.mdns_name}_number_{entity_description.key}"
         )
         self.entity_id = (
-            f"number.{self.coordinator.exoyone.state.mdnsName}_{entity_description.key}"
+            f"number.{self.coordinator.device.mdns_name}_{entity_description.key}"
         )
 
     @property
     def native_value(self) -> float:
         """Return the value of the entity."""
-        return self.coordinator.async_get_sensor_value(self.entity_description.key)
+        return self.coordinator.async_read(self.entity_description.key)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        return await self.coordinator.async_set_value(
-            self.entity_description.key, value
-        )
+        return await self.coordinator.async_write(self.entity_description.key, value)
@@ -0,0 +1,75 @@
+"""Pushed state updates from ExoyONE devices."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Protocol
+
+from exoyone import ExoyOneException, ExoyOneTimeoutError
+
+from .const import DOMAIN, LOGGER, MAX_RECONNECT_INTERVAL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from exoyone import ExoyOneState
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
+
+
+class PushCapableClient(Protocol):
+    """A client that can push state changes as they happen."""
+
+    async def async_listen(self, on_state: Callable[[ExoyOneState], None]) -> None:
+        """Call on_state with the current state, then on every change."""
+
+
+class ExoyOnePushListener:
+    """Keep a push subscription to one device open for its coordinator."""
+
+    def __init__(self, coordinator: ExoyOneDataUpdateCoordinator) -> None:
+        """Initialize."""
+        self._coordinator = coordinator
+        self._task: asyncio.Task[None] | None = None
+
+    def async_start(self) -> None:
+        """Subscribe if the client supports pushed updates."""
+        client = self._coordinator.exoyone
+        if not callable(getattr(client, "async_listen", None)):
+            return
+        entry = self._coordinator.config_entry
+        self._task = entry.async_create_background_task(
+            self._coordinator.hass,
+            self._async_listen(client),
+            f"{DOMAIN} {entry.title} push listener",
+        )
+
+    def async_restart(self) -> None:
+        """Subscribe to a new client after the device moved."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._coordinator.async_push_disconnected()
+        self.async_start()
+
+    async def _async_listen(self, client: PushCapableClient) -> None:
+        """Stay subscribed, reconnecting with backoff while polling fills in."""
+        delay = 1.0
+        while True:
+            try:
+                await client.async_listen(self._async_on_state)
+            except (ExoyOneTimeoutError, ExoyOneException, OSError) as exception:
+                LOGGER.debug(
+                    "Push connection to %s failed: %s",
+                    self._coordinator.config_entry.title,
+                    exception,
+                )
+            if self._coordinator.push_connected:
+                delay = 1.0
+            self._coordinator.async_push_disconnected()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_INTERVAL.total_seconds())
+
+    def _async_on_state(self, state: ExoyOneState) -> None:
+        """Hand a pushed state to the coordinator."""
+        self._coordinator.async_handle_push(state)
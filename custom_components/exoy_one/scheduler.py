@@ -0,0 +1,92 @@
+"""Domain-wide poll scheduler for ExoyONE devices."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .const import DATA_POLL_SCHEDULER, MAX_CONCURRENT_POLLS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+
+class ExoyOnePollScheduler:
+    """Spread the polls of all devices and cap how many run at once."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize."""
+        self._max_concurrent = max_concurrent
+        self._slots: dict[str, float] = {}
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    def async_register(self, entry_id: str) -> None:
+        """Give a device its own poll phase."""
+        self._slots[entry_id] = 0.0
+        self._async_rebalance()
+
+    def async_unregister(self, entry_id: str) -> None:
+        """Release the poll phase of a device."""
+        if self._slots.pop(entry_id, None) is not None:
+            self._async_rebalance()
+
+    def _async_rebalance(self) -> None:
+        """Spread the phases of all devices evenly, with a little jitter."""
+        count = len(self._slots)
+        for index, entry_id in enumerate(self._slots):
+            jitter = random.random() / 2  # noqa: S311
+            self._slots[entry_id] = (index + jitter) / count
+
+    def async_next_delay(self, entry_id: str, interval: float) -> float:
+        """Return the seconds until the next poll slot of a device."""
+        phase = self._slots.get(entry_id, 0.0) * interval
+        delay = (phase - monotonic()) % interval
+        if delay < interval / 2:
+            delay += interval
+        return delay
+
+    @asynccontextmanager
+    async def async_poll_slot(self, *, priority: bool = False) -> AsyncIterator[None]:
+        """Wait for a free poll slot; recently commanded devices go first."""
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(
+                self._waiters, (0 if priority else 1, next(self._counter), waiter)
+            )
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._async_release()
+                raise
+        try:
+            yield
+        finally:
+            self._async_release()
+
+    def _async_release(self) -> None:
+        """Hand a poll slot to the next waiter or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+
+def async_get_poll_scheduler(hass: HomeAssistant) -> ExoyOnePollScheduler:
+    """Return the poll scheduler shared by all config entries."""
+    if DATA_POLL_SCHEDULER not in hass.data:
+        hass.data[DATA_POLL_SCHEDULER] = ExoyOnePollScheduler()
+    return hass.data[DATA_POLL_SCHEDULER]
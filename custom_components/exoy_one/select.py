@@ -4,12 +4,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.components.select import (
+    ATTR_OPTIONS,
+    SelectEntity,
+    SelectEntityDescription,
+)
 from homeassistant.const import EntityCategory
 
 from .entity import ExoyOneEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -50,6 +56,9 @@ async def async_setup_entry(
 class ExoyOneSelect(ExoyOneEntity, SelectEntity):
     """ExoyOne Select class."""
 
+    # The options come from the static mode pack catalog.
+    _unrecorded_attributes = frozenset({ATTR_OPTIONS})
+
     def __init__(
         self,
         coordinator: ExoyOneDataUpdateCoordinator,
@@ -60,24 +69,22 @@ class ExoyOneSelect(ExoyOneEntity, SelectEntity):
         self.entity_description = entity_description
         self._attr_name = entity_description.name
         self.entity_id = (
-            f"select.{self.coordinator.exoyone.state.mdnsName}_{entity_description.key}"
+            f"select.{self.coordinator.device.mdns_name}_{entity_description.key}"
         )
-        mdns_name = self.coordinator.exoyone.state.mdnsName
+        mdns_name = self.coordinator.device.mdns_name
         key = entity_description.key
         self._attr_unique_id = f"{mdns_name}_selects_{key}"
 
     @property
-    def current_option(self) -> str:
+    def current_option(self) -> str | None:
         """Return the current selected option."""
-        return self.coordinator.async_current_option(self.entity_description.key)
+        return self.coordinator.async_read(self.entity_description.key)
 
     @property
-    def options(self) -> list[str]:
+    def options(self) -> Sequence[str]:
         """Return the list of available options."""
-        return self.coordinator.async_all_options(self.entity_description.key)
+        return self.coordinator.async_options(self.entity_description.key)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        return await self.coordinator.async_select_option(
-            self.entity_description.key, option
-        )
+        return await self.coordinator.async_write(self.entity_description.key, option)
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.const import EntityCategory
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
 
 from .entity import ExoyOneEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
 
     from .coordinator import ExoyOneDataUpdateCoordinator
     from .data import ExoyOneConfigEntry
@@ -34,6 +44,84 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class ExoyOneDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes an ExoyONE performance diagnostic sensor."""
+
+    value_fn: Callable[[ExoyOneDataUpdateCoordinator], StateType | datetime]
+
+
+def _milliseconds(rtt: float | None) -> float | None:
+    """Convert a round-trip time to milliseconds."""
+    return None if rtt is None else round(rtt * 1000, 1)
+
+
+DIAGNOSTIC_DESCRIPTIONS = (
+    *(
+        ExoyOneDiagnosticSensorEntityDescription(
+            key=f"{kind}_rtt_p{percent}",
+            name=f"{kind.capitalize()} round trip p{percent}",
+            icon="mdi:timer-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            value_fn=lambda coordinator, kind=kind, percent=percent: _milliseconds(
+                getattr(coordinator.statistics, f"{kind}s").percentile(percent)
+            ),
+        )
+        for kind in ("poll", "command")
+        for percent in (50, 95, 99)
+    ),
+    ExoyOneDiagnosticSensorEntityDescription(
+        key="timeouts",
+        name="Timeouts",
+        icon="mdi:timer-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.statistics.timeouts,
+    ),
+    ExoyOneDiagnosticSensorEntityDescription(
+        key="errors",
+        name="Errors",
+        icon="mdi:alert-circle-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.statistics.errors,
+    ),
+    ExoyOneDiagnosticSensorEntityDescription(
+        key="consecutive_failures",
+        name="Consecutive failures",
+        icon="mdi:alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.statistics.consecutive_failures,
+    ),
+    ExoyOneDiagnosticSensorEntityDescription(
+        key="last_success",
+        name="Last good state",
+        icon="mdi:clock-check-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda coordinator: coordinator.statistics.last_success,
+    ),
+    ExoyOneDiagnosticSensorEntityDescription(
+        key="dropped_writes",
+        name="Dropped writes",
+        icon="mdi:debug-step-over",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.dropped_writes,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
     entry: ExoyOneConfigEntry,
@@ -47,6 +135,13 @@ async def async_setup_entry(
         )
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_entities(
+        ExoyOneDiagnosticSensor(
+            coordinator=entry.runtime_data.coordinator,
+            entity_description=entity_description,
+        )
+        for entity_description in DIAGNOSTIC_DESCRIPTIONS
+    )
 
 
 class ExoyOneSensor(ExoyOneEntity, SensorEntity):
@@ -62,13 +157,39 @@ class ExoyOneSensor(ExoyOneEntity, SensorEntity):
         self.entity_description = entity_description
         self._attr_name = entity_description.name
         self.entity_id = (
-            f"sensor.{self.coordinator.exoyone.state.mdnsName}_{entity_description.key}"
+            f"sensor.{self.coordinator.device.mdns_name}_{entity_description.key}"
         )
         self._attr_unique_id = (
-            f"{self.coordinator.exoyone.state.mdnsName}_sensor_{entity_description.key}"
+            f"{self.coordinator.device.mdns_name}_sensor_{entity_description.key}"
         )
 
     @property
     def native_value(self) -> str | None:
         """Return the native value of the sensor."""
-        return self.coordinator.async_get_sensor_value(self.entity_description.key)
+        return self.coordinator.async_read(self.entity_description.key)
+
+
+class ExoyOneDiagnosticSensor(ExoyOneSensor):
+    """ExoyOne performance diagnostic sensor class."""
+
+    entity_description: ExoyOneDiagnosticSensorEntityDescription
+
+    @property
+    def should_poll(self) -> bool:
+        """Return True, these sensors refresh on their own schedule."""
+        # The statistics change on every poll and command, even when the device
+        # state does not, so coordinator updates skip these sensors.
+        return True
+
+    @property
+    def available(self) -> bool:
+        """Return True, statistics are most useful while the device is down."""
+        return True
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the value of the statistic."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    async def async_update(self) -> None:
+        """Skip the coordinator refresh, the statistics are already current."""
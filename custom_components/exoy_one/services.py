@@ -0,0 +1,216 @@
+"""Services for ExoyONE."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_EFFECT,
+    ATTR_HS_COLOR,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN, MAX_CONCURRENT_SCENE_COMMANDS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
+    from .data import ExoyOneConfigEntry
+
+ATTR_POWER = "power"
+
+SERVICE_APPLY_SCENE = "apply_scene"
+SERVICE_DUMP_TRACES = "dump_traces"
+SERVICE_STREAM_COLOR = "stream_color"
+
+HS_COLOR_SCHEMA = vol.All(
+    vol.Coerce(tuple),
+    vol.ExactSequence(
+        (
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=360)),
+            vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        )
+    ),
+)
+BRIGHTNESS_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=0, max=255))
+
+APPLY_SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_POWER, default=True): cv.boolean,
+        vol.Optional(ATTR_EFFECT): cv.string,
+        vol.Optional(ATTR_HS_COLOR): HS_COLOR_SCHEMA,
+        vol.Optional(ATTR_BRIGHTNESS): BRIGHTNESS_SCHEMA,
+    }
+)
+
+STREAM_COLOR_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_HS_COLOR): HS_COLOR_SCHEMA,
+        vol.Optional(ATTR_BRIGHTNESS): BRIGHTNESS_SCHEMA,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the ExoyONE services."""
+
+    async def async_apply_scene(call: ServiceCall) -> ServiceResponse:
+        """Send the same scene to several devices at once."""
+        coordinators = _async_get_coordinators(hass, call.data[ATTR_DEVICE_ID])
+
+        # Resolve everything up front so the devices only wait on the network
+        # once the commands are released.
+        power = call.data[ATTR_POWER]
+        effect = call.data.get(ATTR_EFFECT)
+        if effect is not None and any(
+            effect not in coordinator.modes.effect_indices
+            for coordinator in coordinators.values()
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="unknown_effect",
+                translation_placeholders={"effect": effect},
+            )
+
+        release = asyncio.Event()
+        slots = asyncio.Semaphore(MAX_CONCURRENT_SCENE_COMMANDS)
+        started = 0.0
+
+        async def async_apply(coordinator: ExoyOneDataUpdateCoordinator) -> float:
+            await release.wait()
+            async with slots:
+                if power:
+                    await coordinator.async_turn_on_light(
+                        effect=effect,
+                        hs_color=call.data.get(ATTR_HS_COLOR),
+                        brightness=call.data.get(ATTR_BRIGHTNESS),
+                    )
+                else:
+                    await coordinator.async_turn_off_light()
+            return monotonic() - started
+
+        tasks = [
+            asyncio.create_task(async_apply(coordinator))
+            for coordinator in coordinators.values()
+        ]
+        started = monotonic()
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        completed = [result for result in results if isinstance(result, float)]
+        return {
+            "devices": {
+                name: (
+                    {"completed_ms": round(result * 1000, 1)}
+                    if isinstance(result, float)
+                    else {"error": str(result) or type(result).__name__}
+                )
+                for name, result in zip(coordinators, results, strict=True)
+            },
+            "skew_ms": (
+                round((max(completed) - min(completed)) * 1000, 1)
+                if completed
+                else None
+            ),
+        }
+
+    @callback
+    def async_stream_color(call: ServiceCall) -> ServiceResponse:
+        """Queue a color frame for each device without waiting for it."""
+        coordinators = _async_get_coordinators(hass, call.data[ATTR_DEVICE_ID])
+        brightness = call.data.get(ATTR_BRIGHTNESS)
+        if brightness is None:
+            # A device restored without a cached state has no brightness to
+            # keep until it first answers.
+            for name, coordinator in coordinators.items():
+                if coordinator.data.brightness is None:
+                    raise ServiceValidationError(
+                        translation_domain=DOMAIN,
+                        translation_key="unknown_brightness",
+                        translation_placeholders={"device": name},
+                    )
+        for coordinator in coordinators.values():
+            coordinator.stream.async_submit(
+                call.data[ATTR_HS_COLOR],
+                coordinator.data.brightness if brightness is None else brightness,
+            )
+        return {
+            "devices": {
+                name: coordinator.stream.as_dict()
+                for name, coordinator in coordinators.items()
+            }
+        }
+
+    @callback
+    def async_dump_traces(call: ServiceCall) -> ServiceResponse:  # noqa: ARG001
+        """Return the traces buffered for every loaded device."""
+        entries: list[ExoyOneConfigEntry] = hass.config_entries.async_entries(DOMAIN)
+        return {
+            "traces": {
+                entry.title: entry.runtime_data.coordinator.tracer.dump()
+                for entry in entries
+                if entry.state is ConfigEntryState.LOADED
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_SCENE,
+        async_apply_scene,
+        schema=APPLY_SCENE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STREAM_COLOR,
+        async_stream_color,
+        schema=STREAM_COLOR_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACES,
+        async_dump_traces,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def _async_get_coordinators(
+    hass: HomeAssistant, device_ids: list[str]
+) -> dict[str, ExoyOneDataUpdateCoordinator]:
+    """Return the coordinators of the targeted devices by device name."""
+    device_registry = dr.async_get(hass)
+    coordinators: dict[str, ExoyOneDataUpdateCoordinator] = {}
+    for device_id in device_ids:
+        device = device_registry.async_get(device_id)
+        entry: ExoyOneConfigEntry | None = next(
+            (
+                entry
+                for entry_id in (device.config_entries if device else ())
+                if (entry := hass.config_entries.async_get_entry(entry_id))
+                and entry.domain == DOMAIN
+            ),
+            None,
+        )
+        if entry is None or entry.state is not ConfigEntryState.LOADED:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="device_not_loaded",
+                translation_placeholders={"device_id": device_id},
+            )
+        coordinators[entry.title] = entry.runtime_data.coordinator
+    return coordinators
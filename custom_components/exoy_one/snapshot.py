@@ -0,0 +1,59 @@
+"""Immutable snapshots of the ExoyONE device state."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import STATE_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+class ExoyOneSnapshot:
+    """The state of a device at one version; never changes once created."""
+
+    __slots__ = (*STATE_FIELDS, "_derived", "version")
+
+    version: int
+    _derived: dict[str, Any]
+
+    def __init__(self, version: int, values: Mapping[str, Any]) -> None:
+        """Initialize from the values of all state fields."""
+        for field in STATE_FIELDS:
+            object.__setattr__(self, field, values[field])
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "_derived", {})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Refuse to change a snapshot."""
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __getitem__(self, field: str) -> Any:
+        """Return the value of a state field."""
+        return getattr(self, field)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both snapshots hold the same state."""
+        if not isinstance(other, ExoyOneSnapshot):
+            return NotImplemented
+        return all(self[field] == other[field] for field in STATE_FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def replace(self, **changes: Any) -> ExoyOneSnapshot:
+        """Return the next version with some fields changed."""
+        return ExoyOneSnapshot(self.version + 1, {**self.as_dict(), **changes})
+
+    def derive(self, name: str, compute: Callable[[ExoyOneSnapshot], Any]) -> Any:
+        """Return a value computed from this snapshot, computing it only once."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = compute(self)
+            return value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state fields as a dict."""
+        return {field: self[field] for field in STATE_FIELDS}
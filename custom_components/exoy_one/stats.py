@@ -0,0 +1,117 @@
+"""Rolling performance statistics for an ExoyONE device."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    MAX_TIMEOUT,
+    MIN_TIMEOUT,
+    MIN_TIMEOUT_SAMPLES,
+    STATISTICS_WINDOW,
+    TIMEOUT_RTT_FACTOR,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class RoundTripTimes:
+    """Rolling window of round-trip times, in seconds."""
+
+    def __init__(self, window: int = STATISTICS_WINDOW) -> None:
+        """Initialize."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, rtt: float) -> None:
+        """Record one round trip."""
+        self._samples.append(rtt)
+        self.count += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a percentile of the recent round trips, in seconds."""
+        if not self._samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+    def timeout(self) -> float:
+        """Return a timeout the device rarely exceeds, in seconds."""
+        if len(self._samples) < MIN_TIMEOUT_SAMPLES:
+            return MAX_TIMEOUT
+        rtt = self.percentile(99) or 0.0
+        return min(max(rtt * TIMEOUT_RTT_FACTOR, MIN_TIMEOUT), MAX_TIMEOUT)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the percentiles in milliseconds."""
+        result: dict[str, Any] = {"count": self.count}
+        for percent in (50, 95, 99):
+            rtt = self.percentile(percent)
+            result[f"p{percent}_ms"] = None if rtt is None else round(rtt * 1000, 1)
+        result["timeout_ms"] = round(self.timeout() * 1000, 1)
+        return result
+
+
+@dataclass
+class ExoyOneStatistics:
+    """Poll and command statistics of one device."""
+
+    polls: RoundTripTimes = field(default_factory=RoundTripTimes)
+    commands: RoundTripTimes = field(default_factory=RoundTripTimes)
+    pushes: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    last_success: datetime | None = None
+    _last_success_monotonic: float | None = None
+
+    def record_poll(self, rtt: float) -> None:
+        """Record a successful poll."""
+        self.polls.add(rtt)
+        self.consecutive_failures = 0
+        self.last_success = dt_util.utcnow()
+        self._last_success_monotonic = monotonic()
+
+    def record_push(self) -> None:
+        """Record a state the device pushed."""
+        self.pushes += 1
+        self.consecutive_failures = 0
+        self.last_success = dt_util.utcnow()
+        self._last_success_monotonic = monotonic()
+
+    def record_command(self, rtt: float) -> None:
+        """Record a successful command."""
+        self.commands.add(rtt)
+
+    def record_failure(self, *, timeout: bool) -> None:
+        """Record a failed poll or command."""
+        if timeout:
+            self.timeouts += 1
+        else:
+            self.errors += 1
+        self.consecutive_failures += 1
+
+    @property
+    def seconds_since_success(self) -> float | None:
+        """Return the time since the last good state, in seconds."""
+        if self._last_success_monotonic is None:
+            return None
+        return monotonic() - self._last_success_monotonic
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "polls": self.polls.as_dict(),
+            "commands": self.commands.as_dict(),
+            "pushes": self.pushes,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "consecutive_failures": self.consecutive_failures,
+            "seconds_since_success": self.seconds_since_success,
+        }
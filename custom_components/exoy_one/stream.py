@@ -0,0 +1,78 @@
+"""Latest-wins color streaming for ExoyONE lights."""
+
+from __future__ import annotations
+
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from exoyone import ExoyOneException, ExoyOneTimeoutError
+
+from .const import DOMAIN, LOGGER, STREAM_FPS_WINDOW
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
+
+
+class ExoyOneColorStream:
+    """Send only the newest color frame, with one request in flight at a time."""
+
+    def __init__(self, coordinator: ExoyOneDataUpdateCoordinator) -> None:
+        """Initialize."""
+        self._coordinator = coordinator
+        self._latest: tuple[int, float, int] | None = None
+        self._sender: asyncio.Task[None] | None = None
+        self._sent_at: deque[float] = deque(maxlen=STREAM_FPS_WINDOW)
+        self.sent = 0
+        self.dropped = 0
+
+    def async_submit(self, hs_color: tuple[float, float], brightness: int) -> None:
+        """Queue a frame, replacing any frame that was not sent yet."""
+        hue, saturation = hs_color
+        if self._latest is not None:
+            self.dropped += 1
+        self._latest = (int((hue / 360) * 255), saturation, brightness)
+
+        if self._sender is None:
+            entry = self._coordinator.config_entry
+            self._sender = entry.async_create_background_task(
+                self._coordinator.hass,
+                self._async_send(),
+                f"{DOMAIN} {entry.title} color stream",
+            )
+
+    async def _async_send(self) -> None:
+        """Send frames until no newer frame is waiting."""
+        coordinator = self._coordinator
+        try:
+            while (frame := self._latest) is not None:
+                self._latest = None
+                try:
+                    await coordinator.async_send_color_frame(frame)
+                except (ExoyOneTimeoutError, ExoyOneException) as exception:
+                    LOGGER.debug(
+                        "Skipped a streamed frame for %s: %s",
+                        coordinator.config_entry.title,
+                        exception,
+                    )
+                    continue
+                self.sent += 1
+                self._sent_at.append(monotonic())
+        finally:
+            self._sender = None
+        # Pick up the final state quickly once the stream goes quiet.
+        coordinator.async_mark_active()
+
+    @property
+    def fps(self) -> float:
+        """Return the frames per second achieved over the recent frames."""
+        if len(self._sent_at) < 2:  # noqa: PLR2004
+            return 0.0
+        elapsed = self._sent_at[-1] - self._sent_at[0]
+        return (len(self._sent_at) - 1) / elapsed if elapsed else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stream statistics."""
+        return {"fps": round(self.fps, 1), "sent": self.sent, "dropped": self.dropped}
@@ -80,26 +80,28 @@ class ExoyOneSwitch(ExoyOneEntity, SwitchEntity):
         self.entity_description = entity_description
         self._attr_name = entity_description.name
         self.entity_id = (
-            f"switch.{self.coordinator.state.mdnsName}_{entity_description.key}"
+            f"switch.{self.coordinator.device.mdns_name}_{entity_description.key}"
         )
         self._attr_unique_id = (
-            f"{self.coordinator.state.mdnsName}_switch_{entity_description.key}"
+            f"{self.coordinator.device.mdns_name}_switch_{entity_description.key}"
         )
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        return self.coordinator.async_is_on(self.entity_description.key)
+        return self.coordinator.async_read(self.entity_description.key)
 
     @property
     def available(self) -> bool:
         """Return true if the switch is available."""
-        return self.coordinator.async_is_available(self.entity_description.key)
+        return super().available and self.coordinator.async_is_available(
+            self.entity_description.key
+        )
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the switch."""
-        await self.coordinator.async_turn_on(self.entity_description.key)
+        await self.coordinator.async_write(self.entity_description.key, value=True)
 
     async def async_turn_off(self, **_: Any) -> None:
         """Turn off the switch."""
-        await self.coordinator.async_turn_off(self.entity_description.key)
+        await self.coordinator.async_write(self.entity_description.key, value=False)
@@ -0,0 +1,147 @@
+"""Opt-in tracing of ExoyONE device calls and entity state writes."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from time import perf_counter, time
+from typing import TYPE_CHECKING, Any
+
+from exoyone import ExoyOneTimeoutError
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    TRACE_BUFFER,
+    TRACE_BUFFER_SIZE,
+    TRACE_LOGGER,
+    TRACE_OFF,
+    TRACE_OPENTELEMETRY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+
+_NO_SPAN = nullcontext()
+
+
+@dataclass(frozen=True, slots=True)
+class Span:
+    """One traced device call or entity state write."""
+
+    name: str
+    device: str
+    key: str | None
+    start: float
+    duration: float
+    outcome: str
+
+
+def log_sink(span: Span) -> None:
+    """Write a span to the debug log."""
+    LOGGER.debug(
+        "%s %s %s: %s in %.1f ms",
+        span.device,
+        span.name,
+        span.key or "",
+        span.outcome,
+        span.duration * 1000,
+    )
+
+
+class RingBufferSink:
+    """Keep the most recent spans in memory."""
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize."""
+        self._spans: deque[Span] = deque(maxlen=size)
+
+    def __call__(self, span: Span) -> None:
+        """Store a span."""
+        self._spans.append(span)
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Return the buffered spans, oldest first."""
+        return [asdict(span) for span in self._spans]
+
+
+class OpenTelemetrySink:
+    """Export spans through the OpenTelemetry API."""
+
+    def __init__(self) -> None:
+        """Initialize; raises ImportError if OpenTelemetry is not installed."""
+        from opentelemetry import trace  # noqa: PLC0415
+
+        self._tracer = trace.get_tracer(DOMAIN)
+
+    def __call__(self, span: Span) -> None:
+        """Export a span."""
+        start = int(span.start * 1e9)
+        self._tracer.start_span(
+            f"{DOMAIN}.{span.name}",
+            start_time=start,
+            attributes={
+                "exoy_one.device": span.device,
+                "exoy_one.key": span.key or "",
+                "exoy_one.outcome": span.outcome,
+            },
+        ).end(end_time=start + int(span.duration * 1e9))
+
+
+class Tracer:
+    """Create spans and hand them to the configured sink."""
+
+    def __init__(self, device: str, sink_type: str = TRACE_OFF) -> None:
+        """Initialize."""
+        self.device = device
+        self.sink: Callable[[Span], None] | None = None
+        self.configure(sink_type)
+
+    def configure(self, sink_type: str) -> None:
+        """Select where spans go, or turn tracing off."""
+        self.sink = None
+        if sink_type == TRACE_LOGGER:
+            self.sink = log_sink
+        elif sink_type == TRACE_BUFFER:
+            self.sink = RingBufferSink()
+        elif sink_type == TRACE_OPENTELEMETRY:
+            try:
+                self.sink = OpenTelemetrySink()
+            except ImportError:
+                LOGGER.warning(
+                    "OpenTelemetry is not installed, logging %s traces instead",
+                    self.device,
+                )
+                self.sink = log_sink
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Return the buffered spans if the ring buffer sink is used."""
+        if isinstance(self.sink, RingBufferSink):
+            return self.sink.dump()
+        return []
+
+    def span(self, name: str, key: str | None = None) -> AbstractContextManager:
+        """Return a context manager that traces the code it wraps."""
+        if self.sink is None:
+            return _NO_SPAN
+        return self._span(self.sink, name, key)
+
+    @contextmanager
+    def _span(
+        self, sink: Callable[[Span], None], name: str, key: str | None
+    ) -> Iterator[None]:
+        """Time the wrapped code and report its outcome."""
+        start, started = time(), perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except ExoyOneTimeoutError:
+            outcome = "timeout"
+            raise
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            sink(Span(name, self.device, key, start, perf_counter() - started, outcome))
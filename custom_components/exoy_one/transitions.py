@@ -0,0 +1,148 @@
+"""Client-side brightness and color transitions for ExoyONE lights."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .const import DATA_TRANSITIONS, DOMAIN, LOGGER, TRANSITION_FPS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import ExoyOneDataUpdateCoordinator
+
+
+@dataclass
+class _Transition:
+    """A running transition of one light."""
+
+    coordinator: ExoyOneDataUpdateCoordinator
+    start: dict[str, float]
+    target: dict[str, float]
+    duration: float
+    done: asyncio.Future[bool]
+    started: float = field(default_factory=monotonic)
+    frame: asyncio.Task[None] | None = None
+    last: dict[str, float] | None = None
+    frames: int = 0
+    dropped: int = 0
+
+    def values_at(self, now: float) -> dict[str, float]:
+        """Return the interpolated values at the given time."""
+        progress = min(1.0, (now - self.started) / self.duration)
+        values = {}
+        for key, target in self.target.items():
+            delta = target - self.start[key]
+            if key == "hue":
+                # Go the short way around the device's 256 step color wheel.
+                delta = (delta + 128) % 256 - 128
+            values[key] = self.start[key] + delta * progress
+            if key == "hue":
+                values[key] %= 256
+        return values
+
+
+class ExoyOneTransitionScheduler:
+    """Drive the transitions of all lights from one shared ticker."""
+
+    def __init__(self, hass: HomeAssistant, fps: int = TRANSITION_FPS) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._interval = 1 / fps
+        self._transitions: dict[str, _Transition] = {}
+        self._ticker: asyncio.Task[None] | None = None
+
+    async def async_run(
+        self,
+        coordinator: ExoyOneDataUpdateCoordinator,
+        target: dict[str, float],
+        duration: float,
+    ) -> bool:
+        """Fade a light to the target; return False if it was cancelled."""
+        entry_id = coordinator.config_entry.entry_id
+        self.async_cancel(entry_id)
+        transition = _Transition(
+            coordinator=coordinator,
+            start={key: coordinator.data[key] for key in target},
+            target=target,
+            duration=duration,
+            done=self._hass.loop.create_future(),
+        )
+        self._transitions[entry_id] = transition
+        if self._ticker is None:
+            self._ticker = self._hass.async_create_background_task(
+                self._async_tick(), f"{DOMAIN} transitions"
+            )
+        try:
+            return await transition.done
+        except asyncio.CancelledError:
+            self.async_cancel(entry_id)
+            raise
+
+    def async_cancel(self, entry_id: str) -> None:
+        """Stop the transition of a light where it currently is."""
+        if (transition := self._transitions.pop(entry_id, None)) is not None:
+            self._async_finish(transition, completed=False)
+
+    async def _async_tick(self) -> None:
+        """Send a frame to every light that is ready for one."""
+        try:
+            while self._transitions:
+                now = monotonic()
+                for entry_id, transition in list(self._transitions.items()):
+                    if transition.frame is not None and not transition.frame.done():
+                        # The device is still busy with the previous frame.
+                        transition.dropped += 1
+                        continue
+                    if now - transition.started >= transition.duration:
+                        # The caller sends the target itself as the last frame.
+                        del self._transitions[entry_id]
+                        self._async_finish(transition, completed=True)
+                        continue
+                    self._async_send_frame(transition, transition.values_at(now))
+                await asyncio.sleep(self._interval)
+        finally:
+            self._ticker = None
+            for transition in self._transitions.values():
+                self._async_finish(transition, completed=False)
+            self._transitions.clear()
+
+    def _async_send_frame(
+        self, transition: _Transition, values: dict[str, float]
+    ) -> None:
+        """Send one frame unless it looks the same as the previous one."""
+        frame = {
+            key: round(value) if key == "brightness" else value
+            for key, value in values.items()
+        }
+        if frame == transition.last:
+            return
+        transition.last = frame
+        transition.frames += 1
+        coordinator = transition.coordinator
+        transition.frame = coordinator.config_entry.async_create_background_task(
+            self._hass,
+            coordinator.async_send_frame(frame),
+            f"{DOMAIN} {coordinator.config_entry.title} transition frame",
+        )
+
+    def _async_finish(self, transition: _Transition, *, completed: bool) -> None:
+        """Release the caller waiting for a transition."""
+        if not transition.done.done():
+            LOGGER.debug(
+                "Transition of %s ended after %d frames, %d dropped",
+                transition.coordinator.config_entry.title,
+                transition.frames,
+                transition.dropped,
+            )
+            transition.done.set_result(completed)
+
+
+def async_get_transition_scheduler(hass: HomeAssistant) -> ExoyOneTransitionScheduler:
+    """Return the transition scheduler shared by all config entries."""
+    if DATA_TRANSITIONS not in hass.data:
+        hass.data[DATA_TRANSITIONS] = ExoyOneTransitionScheduler(hass)
+    return hass.data[DATA_TRANSITIONS]
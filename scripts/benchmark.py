@@ -0,0 +1,396 @@
+"""
+End-to-end benchmark of the Exoy ONE integration against fake devices.
+
+Drives the real coordinator, platform entities and pyExoyOne client against
+the UDP devices from fake_exoyone.py and reports, for each fleet size:
+
+- poll latency (including the wait for a slot in the poll scheduler)
+- command-to-state latency of ExoyOneLight.async_turn_on
+- entity state writes per device per minute
+- CPU time per device
+- attribute bytes the recorder would store per device per day, with and
+  without the unrecorded attributes
+
+Run from the repository root, for example:
+
+    python scripts/benchmark.py --devices 1 10 100 --duration 30
+
+The devices bind addresses in 127.1.0.0/16, which Linux routes to loopback.
+The same measurements run as a pytest-benchmark suite in tests/.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter, process_time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from exoyone import ExoyOne, mode_packs
+from fake_exoyone import FakeExoyOne, FakeNetwork, PushExoyOne, async_start_fleet
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.exoy_one import (
+    binary_sensor,
+    light,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.exoy_one.const import (
+    DOMAIN,
+    STORAGE_VERSION,
+    TRACE_OFF,
+    TRACE_SINKS,
+)
+from custom_components.exoy_one.coordinator import ExoyOneDataUpdateCoordinator
+from custom_components.exoy_one.modes import ModePackIndex
+from custom_components.exoy_one.scheduler import ExoyOnePollScheduler
+from custom_components.exoy_one.tracing import Tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from custom_components.exoy_one.entity import ExoyOneEntity
+
+PLATFORMS = (
+    (binary_sensor.ExoyOneBinarySensor, binary_sensor.ENTITY_DESCRIPTIONS),
+    (light.ExoyOneLight, light.ENTITY_DESCRIPTIONS),
+    (number.ExoyOneNumber, number.ENTITY_DESCRIPTIONS),
+    (select.ExoyOneSelect, select.ENTITY_DESCRIPTIONS),
+    (sensor.ExoyOneSensor, sensor.ENTITY_DESCRIPTIONS),
+    (switch.ExoyOneSwitch, switch.ENTITY_DESCRIPTIONS),
+)
+
+
+class BenchmarkDevice:
+    """One fake device with a client, coordinator and entities."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        scheduler: ExoyOnePollScheduler,
+        fake: FakeExoyOne,
+        *,
+        idle_interval: float = 15.0,
+        push: bool = False,
+        trace: str = TRACE_OFF,
+    ) -> None:
+        """Initialize."""
+        self.fake = fake
+        self.client = (PushExoyOne if push else ExoyOne)(host=fake.host)
+        entry_id = f"benchmark_{fake.host}"
+        self.coordinator = ExoyOneDataUpdateCoordinator(
+            hass,
+            idle_interval=timedelta(seconds=idle_interval),
+            scheduler=scheduler,
+            store=Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"),
+            tracer=Tracer(fake.host, trace),
+        )
+        self.coordinator.config_entry = SimpleNamespace(
+            entry_id=entry_id,
+            domain=DOMAIN,
+            title=fake.host,
+            pref_disable_polling=False,
+            async_create_background_task=self._async_create_background_task,
+            runtime_data=SimpleNamespace(
+                exoyone=self.client, host=fake.host, coordinator=self.coordinator
+            ),
+        )
+        self.coordinator.async_bind_client()
+        scheduler.async_register(self.coordinator.config_entry.entry_id)
+        self.tasks: set[asyncio.Task[Any]] = set()
+        self.entities: list[ExoyOneEntity] = []
+        self.writes = 0
+        self.attribute_bytes = {"all": 0, "recorded": 0}
+        self._last_attributes: dict[tuple[str, str], str] = {}
+        self.poll_latencies: list[float] = []
+        self.light_written: asyncio.Event = asyncio.Event()
+
+    async def async_setup(self, hass: HomeAssistant) -> None:
+        """Fetch the device and add its entities like the platforms do."""
+        await self.client.async_get_data()
+        self.coordinator.async_set_initial_data()
+
+        update_data = self.coordinator._async_update_data
+
+        async def _async_timed_update_data() -> dict[str, Any]:
+            start = perf_counter()
+            try:
+                return await update_data()
+            finally:
+                self.poll_latencies.append(perf_counter() - start)
+
+        self.coordinator._async_update_data = _async_timed_update_data
+        self.coordinator.push.async_start()
+
+        for entity_class, descriptions in PLATFORMS:
+            for description in descriptions:
+                entity = entity_class(
+                    coordinator=self.coordinator, entity_description=description
+                )
+                entity.hass = hass
+                entity.async_write_ha_state = self._async_count_write(entity)
+                await entity.async_added_to_hass()
+                self.entities.append(entity)
+
+    def _async_create_background_task(
+        self,
+        hass: HomeAssistant,
+        target: Coroutine[Any, Any, Any],
+        name: str,
+        *,
+        eager_start: bool = True,
+    ) -> asyncio.Task[Any]:
+        """Create a task that is cancelled when the benchmark tears down."""
+        task = hass.async_create_background_task(target, name, eager_start=eager_start)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    def _async_count_write(self, entity: ExoyOneEntity) -> Callable[[], None]:
+        """Return a replacement for async_write_ha_state that counts writes."""
+
+        def _async_write_ha_state() -> None:
+            self.writes += 1
+            self._async_count_attributes(entity)
+            if isinstance(entity, light.ExoyOneLight):
+                self.light_written.set()
+
+        return _async_write_ha_state
+
+    def _async_count_attributes(self, entity: ExoyOneEntity) -> None:
+        """
+        Add up the attribute bytes the recorder would store for a write.
+
+        The recorder only stores an attribute set again when it changed.
+        """
+        attributes = {
+            **(entity.capability_attributes or {}),
+            **(entity.state_attributes or {}),
+        }
+        unrecorded = (
+            entity._entity_component_unrecorded_attributes
+            | entity._unrecorded_attributes
+        )
+        for kind, recorded in (
+            ("all", attributes),
+            (
+                "recorded",
+                {k: v for k, v in attributes.items() if k not in unrecorded},
+            ),
+        ):
+            encoded = json.dumps(recorded, default=str)
+            if self._last_attributes.get((entity.unique_id, kind)) != encoded:
+                self._last_attributes[(entity.unique_id, kind)] = encoded
+                self.attribute_bytes[kind] += len(encoded)
+
+    @property
+    def light_entity(self) -> light.ExoyOneLight:
+        """Return the light entity."""
+        return next(e for e in self.entities if isinstance(e, light.ExoyOneLight))
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    """Return a percentile of the samples in milliseconds."""
+    if not samples:
+        return float("nan")
+    if len(samples) == 1:
+        return samples[0] * 1000
+    return statistics.quantiles(samples, n=100)[percent - 1] * 1000
+
+
+async def async_setup_fleet(
+    hass: HomeAssistant,
+    fakes: list[FakeExoyOne],
+    **kwargs: Any,
+) -> list[BenchmarkDevice]:
+    """Set up a coordinator and entities for every fake device."""
+    scheduler = ExoyOnePollScheduler()
+    devices = [BenchmarkDevice(hass, scheduler, fake, **kwargs) for fake in fakes]
+    await asyncio.gather(*(device.async_setup(hass) for device in devices))
+    return devices
+
+
+async def async_unload_fleet(devices: list[BenchmarkDevice]) -> None:
+    """Remove the entities and stop the coordinators and devices."""
+    for device in devices:
+        for entity in device.entities:
+            await entity.async_will_remove_from_hass()
+        await device.coordinator.async_shutdown()
+        for task in list(device.tasks):
+            task.cancel()
+        device.fake.async_stop()
+
+
+async def async_measure_steady_state(
+    devices: list[BenchmarkDevice], duration: float, change_rate: float
+) -> tuple[float, float, dict[str, float]]:
+    """
+    Let the coordinators poll on their own schedule for a while.
+
+    The devices occasionally change from the outside. Returns the state
+    writes per device per minute, the CPU milliseconds per second per device
+    and the attribute kilobytes the recorder would store per device per day.
+    """
+    for device in devices:
+        device.writes = 0
+        device.attribute_bytes = dict.fromkeys(device.attribute_bytes, 0)
+    cpu_start, wall_start = process_time(), perf_counter()
+    deadline = wall_start + duration
+    while (now := perf_counter()) < deadline:
+        for device in devices:
+            if random.random() < change_rate / 60:
+                device.fake.async_external_change()
+        await asyncio.sleep(min(1.0, deadline - now))
+    cpu = process_time() - cpu_start
+    wall = perf_counter() - wall_start
+    count = len(devices)
+    kb_per_day = {
+        kind: sum(d.attribute_bytes[kind] for d in devices) / count / wall * 86.4
+        for kind in ("all", "recorded")
+    }
+    return (
+        sum(d.writes for d in devices) / count / wall * 60,
+        cpu / wall / count * 1000,
+        kb_per_day,
+    )
+
+
+async def async_measure_command(device: BenchmarkDevice) -> tuple[float, float]:
+    """Send one light command and return the time to state and to ack."""
+    device.light_written.clear()
+    start = perf_counter()
+    task = asyncio.create_task(
+        device.light_entity.async_turn_on(
+            hs_color=(random.uniform(0, 360), 100),
+            brightness=random.randint(1, 255),
+        )
+    )
+    await device.light_written.wait()
+    to_state = perf_counter() - start
+    await task
+    return to_state, perf_counter() - start
+
+
+async def async_run_fleet(
+    hass: HomeAssistant, count: int, args: argparse.Namespace
+) -> str:
+    """Benchmark one fleet size and return a result row."""
+    fakes = await async_start_fleet(
+        count, FakeNetwork(latency=args.latency, jitter=args.jitter, loss=args.loss)
+    )
+    devices = await async_setup_fleet(
+        hass,
+        fakes,
+        idle_interval=args.idle_interval,
+        push=args.push,
+        trace=args.trace,
+    )
+    writes_per_minute, cpu, kb_per_day = await async_measure_steady_state(
+        devices, args.duration, args.change_rate
+    )
+
+    # Commands: every device gets a light command at the same time.
+    to_state: list[float] = []
+    to_ack: list[float] = []
+    for _ in range(args.commands):
+        for state_latency, ack_latency in await asyncio.gather(
+            *(async_measure_command(device) for device in devices)
+        ):
+            to_state.append(state_latency)
+            to_ack.append(ack_latency)
+
+    await async_unload_fleet(devices)
+
+    polls = [latency for device in devices for latency in device.poll_latencies]
+    return (
+        f"{count:>7} | {_percentile(polls, 50):>8.1f} {_percentile(polls, 95):>8.1f}"
+        f" | {_percentile(to_state, 50):>8.2f}"
+        f" | {_percentile(to_ack, 50):>8.1f} {_percentile(to_ack, 95):>8.1f}"
+        f" | {writes_per_minute:>10.1f} | {cpu:>10.3f}"
+        f" | {kb_per_day['all']:>9.1f} {kb_per_day['recorded']:>9.1f}"
+    )
+
+
+def benchmark_mode_pack_index(iterations: int = 100_000) -> str:
+    """Compare mode pack lookups through the library and the index."""
+    index = ModePackIndex.from_mode_packs(mode_packs)
+    pairs = list(index.effect_names)
+    names = list(index.effect_indices)
+
+    def library() -> None:
+        for (pi, ei), name in zip(pairs, names, strict=False):
+            mode_packs.get_effect_name_from_index(pi, ei)
+            mode_packs.get_indices_from_effect_name(name)
+            mode_packs.get_effects_by_index(pi)
+
+    def indexed() -> None:
+        for (pi, ei), name in zip(pairs, names, strict=False):
+            index.effect_name(pi, ei)
+            index.effect_indices[name]
+            index.effect_options(pi)
+
+    repeat = max(1, iterations // max(1, len(pairs)))
+    library_time = timeit.timeit(library, number=repeat)
+    indexed_time = timeit.timeit(indexed, number=repeat)
+    return (
+        f"mode pack lookups: library {library_time * 1000:.1f} ms,"
+        f" index {indexed_time * 1000:.1f} ms"
+        f" ({library_time / indexed_time:.1f}x faster)"
+    )
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark for every fleet size."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        print(benchmark_mode_pack_index())
+        print(
+            "devices |  poll p50  poll p95 | state p50 |  ack p50   ack p95"
+            " | writes/min | CPU ms/s/device | attr KB/day  recorded"
+        )
+        for count in args.devices:
+            print(await async_run_fleet(hass, count, args))
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--commands", type=int, default=5)
+    parser.add_argument("--idle-interval", type=float, default=15.0)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument(
+        "--push", action="store_true", help="devices push their state changes"
+    )
+    parser.add_argument("--trace", choices=TRACE_SINKS, default=TRACE_OFF)
+    parser.add_argument(
+        "--change-rate",
+        type=float,
+        default=1.0,
+        help="external state changes per device per minute",
+    )
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
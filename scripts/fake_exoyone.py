@@ -0,0 +1,238 @@
+"""
+Local stand-in for Exoy ONE devices, used for testing and benchmarking.
+
+Every simulated device serves the protocol pyExoyOne speaks: one JSON object
+per UDP datagram on port 8888. A {"getData": 1} request is answered with the
+full state; any other request changes the state and is not answered. Each
+device binds its own loopback address, so the unmodified ExoyOne client can
+talk to it.
+
+On top of that, a device pushes its state to clients that send
+{"subscribe": 1}. Real devices cannot do this; PushExoyOne is the matching
+client for benchmarking the integration's pushed updates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import asdict, dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+import asyncio_dgram
+from exoyone import ExoyOne, ExoyOneState, ExoyOneTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PORT = 8888
+SUBSCRIBE = "subscribe"
+
+# Requests that set a state field to the value sent.
+SETTERS = {
+    "setBrightness": "brightness",
+    "setModPack": "currentModpack",
+    "setEffect": "modeIndex",
+    "setSpeed": "speed",
+    "setHue": "hue",
+    "setSaturation": "saturation",
+    "setName": "userDefinedName",
+    "setCycleSpeed": "cycleSpeed",
+    "setPattern": "selectedPattern",
+    "setRenderMode": "selectedRenderMode",
+    "setColorMode": "selectedColorMode",
+    "setPalette": "selectedPalette",
+}
+# Requests that turn a state field on or off.
+TOGGLES = {
+    "togglePower": "fadingOff",
+    "toggleModeCycle": "autoChange",
+    "toggleMusicSync": "musicSync",
+    "toggleSceneGeneration": "sceneGeneration",
+    "toggleDirection": "direction",
+    "poweredByPowerbank": "poweredByPowerbank",
+}
+
+
+@dataclass(frozen=True)
+class FakeNetwork:
+    """Simulated link conditions between Home Assistant and the devices."""
+
+    latency: float = 0.02
+    jitter: float = 0.01
+    loss: float = 0.0
+
+    def delay(self) -> float:
+        """Return the delay of one datagram, half of a round trip."""
+        return max(0.0, random.gauss(self.latency, self.jitter)) / 2
+
+    def drops(self) -> bool:
+        """Return True if the next datagram gets lost."""
+        return random.random() < self.loss
+
+
+@dataclass
+class FakeExoyOneState:
+    """The state a device reports, with the fields of ExoyOneState."""
+
+    mdnsName: str
+    userDefinedName: str
+    type: int = 4
+    brightness: int = 128
+    currentModpack: int = 0
+    modeIndex: int = 0
+    speed: int = 128
+    hue: int = 0
+    saturation: int = 255
+    autoChange: bool = False
+    musicSync: bool = False
+    fadingOff: bool = True
+    buttonEnabled: bool = True
+    sceneGeneration: bool = False
+    lockColorWheel: bool = False
+    forceMusicSync: bool = False
+    selectedPattern: int = 1
+    selectedRenderMode: int = 1
+    selectedColorMode: int = 1
+    selectedPalette: int = 1
+    cycleSpeed: int = 30
+    # Seconds, while setShutdownTimer takes hours and minutes.
+    shutdownTimer: int = 0
+    direction: bool = False
+    connectedToWiFi: bool = True
+    firmwareVersion: str = "1.0.0"
+    poweredByPowerbank: bool = False
+
+
+@dataclass(eq=False)
+class FakeExoyOne(asyncio.DatagramProtocol):
+    """One simulated device serving the pyExoyOne protocol over UDP."""
+
+    host: str
+    network: FakeNetwork = field(default_factory=FakeNetwork)
+    state: FakeExoyOneState = field(init=False)
+    requests: int = field(default=0, init=False)
+    _loop: asyncio.AbstractEventLoop = field(init=False)
+    _transport: asyncio.DatagramTransport | None = field(default=None, init=False)
+    _subscribers: set[tuple[str, int]] = field(default_factory=set, init=False)
+
+    def __post_init__(self) -> None:
+        """Create the device state."""
+        name = f"exoyone{self.host.replace('.', '')}"
+        self.state = FakeExoyOneState(mdnsName=name, userDefinedName=name)
+
+    async def async_start(self) -> None:
+        """Start answering requests on the device's address."""
+        self._loop = asyncio.get_running_loop()
+        await self._loop.create_datagram_endpoint(
+            lambda: self, local_addr=(self.host, PORT)
+        )
+
+    def async_stop(self) -> None:
+        """Stop answering requests."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        """Keep the transport to answer on."""
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, _exc: Exception | None) -> None:
+        """Forget the transport."""
+        self._transport = None
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Handle a request once it crossed the simulated network."""
+        if self.network.drops():
+            return
+        self._loop.call_later(
+            self.network.delay(), self._handle, json.loads(data), addr
+        )
+
+    def _handle(self, request: dict[str, Any], addr: tuple[str, int]) -> None:
+        """Answer a state request or apply a change."""
+        self.requests += 1
+        if request.get("getData") == 1:
+            self._send(addr, asdict(self.state))
+            return
+        if request.get(SUBSCRIBE) == 1:
+            self._subscribers.add(addr)
+            self._send(addr, asdict(self.state))
+            return
+
+        changes: dict[str, Any] = {}
+        for key, value in request.items():
+            if key in SETTERS:
+                changes[SETTERS[key]] = value
+            elif key in TOGGLES:
+                changes[TOGGLES[key]] = bool(value)
+            elif key == "setShutdownTimer":
+                changes["shutdownTimer"] = (value["hours"] * 60 + value["minutes"]) * 60
+        if changes:
+            self._set_state(replace(self.state, **changes))
+
+    def _send(self, addr: tuple[str, int], message: dict[str, Any]) -> None:
+        """Send a reply across the simulated network."""
+        if self.network.drops():
+            return
+        self._loop.call_later(
+            self.network.delay(), self._deliver, json.dumps(message).encode(), addr
+        )
+
+    def _deliver(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Hand a reply to the client unless the device stopped meanwhile."""
+        if self._transport is not None:
+            self._transport.sendto(data, addr)
+
+    def _set_state(self, state: FakeExoyOneState) -> None:
+        """Change the state and push it to the subscribers."""
+        self.state = state
+        for addr in self._subscribers:
+            self._send(addr, asdict(state))
+
+    def async_external_change(self) -> None:
+        """Simulate a change made from the mobile app or the button."""
+        self._set_state(replace(self.state, brightness=random.randint(1, 255)))
+
+    def async_drop_push(self) -> None:
+        """Simulate the push connections dropping."""
+        for addr in self._subscribers:
+            self._send(addr, {})
+        self._subscribers.clear()
+
+
+async def async_start_fleet(
+    count: int, network: FakeNetwork | None = None
+) -> list[FakeExoyOne]:
+    """Start count devices, each on its own loopback address."""
+    devices = [
+        FakeExoyOne(
+            host=f"127.1.{index // 250}.{index % 250 + 1}",
+            network=network or FakeNetwork(),
+        )
+        for index in range(count)
+    ]
+    await asyncio.gather(*(device.async_start() for device in devices))
+    return devices
+
+
+class PushExoyOne(ExoyOne):
+    """ExoyOne client that also subscribes to a fake device's pushed states."""
+
+    async def async_listen(self, on_state: Callable[[ExoyOneState], None]) -> None:
+        """Push the current state, then every change until the device drops us."""
+        stream = await asyncio_dgram.connect((self.host, self._port))
+        try:
+            await stream.send(json.dumps({SUBSCRIBE: 1}).encode())
+            try:
+                reply, _ = await asyncio.wait_for(stream.recv(), timeout=self.TIMEOUT)
+            except TimeoutError as exception:
+                raise ExoyOneTimeoutError from exception
+            while data := json.loads(reply):
+                self._state = ExoyOneState(**data)
+                on_state(self._state)
+                reply, _ = await stream.recv()
+        finally:
+            stream.close()
+        raise ExoyOneTimeoutError
@@ -0,0 +1 @@
+"""Tests for the Exoy ONE integration."""
@@ -0,0 +1,76 @@
+"""Fixtures for the Exoy ONE tests."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from benchmark import BenchmarkDevice, async_setup_fleet, async_unload_fleet
+from exoyone import ExoyOne
+from fake_exoyone import FakeExoyOne, FakeNetwork, async_start_fleet
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@pytest.fixture
+def runner() -> Iterator[asyncio.Runner]:
+    """Return an event loop the tests and benchmarks run coroutines on."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture
+def hass(runner: asyncio.Runner, tmp_path: Path) -> Iterator[HomeAssistant]:
+    """Return a Home Assistant instance without any integrations set up."""
+
+    async def _async_create() -> HomeAssistant:
+        return HomeAssistant(str(tmp_path))
+
+    hass = runner.run(_async_create())
+    yield hass
+    runner.run(hass.async_stop(force=True))
+
+
+@pytest.fixture
+def network() -> FakeNetwork:
+    """Return fast, lossless link conditions."""
+    return FakeNetwork(latency=0.002, jitter=0.001)
+
+
+@pytest.fixture
+def fake_device(runner: asyncio.Runner, network: FakeNetwork) -> Iterator[FakeExoyOne]:
+    """Return one simulated device."""
+    (device,) = runner.run(async_start_fleet(1, network))
+    yield device
+    device.async_stop()
+
+
+@pytest.fixture
+def client(fake_device: FakeExoyOne) -> ExoyOne:
+    """Return an unmodified pyExoyOne client for the simulated device."""
+    return ExoyOne(host=fake_device.host)
+
+
+@pytest.fixture
+def start_fleet(
+    runner: asyncio.Runner, hass: HomeAssistant, network: FakeNetwork
+) -> Iterator[Callable[..., list[BenchmarkDevice]]]:
+    """Return a function that sets up the integration for simulated devices."""
+    fleets: list[list[BenchmarkDevice]] = []
+
+    def _start_fleet(count: int, **kwargs: Any) -> list[BenchmarkDevice]:
+        fakes = runner.run(async_start_fleet(count, network))
+        fleets.append(runner.run(async_setup_fleet(hass, fakes, **kwargs)))
+        return fleets[-1]
+
+    yield _start_fleet
+    for devices in fleets:
+        runner.run(async_unload_fleet(devices))
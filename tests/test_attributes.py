@@ -0,0 +1,98 @@
+"""Tests for the attribute table against simulated devices."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from exoyone import ExoyOne
+
+from custom_components.exoy_one.attributes import ATTRIBUTES, bind_attributes
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
+    from benchmark import BenchmarkDevice
+
+
+def test_bind_attributes() -> None:
+    """Every writable attribute has a writer and a method of the library."""
+    methods = bind_attributes(ExoyOne(host="127.0.0.1"))
+    for key, attribute in ATTRIBUTES.items():
+        assert (attribute.method is None) == (attribute.write is None)
+        assert (key in methods) == (attribute.method is not None)
+
+
+def test_speed(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """The speed is a percentage of the device's 0-255 scale."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    runner.run(coordinator.async_write("speed", 100))
+    assert device.fake.state.speed == 255
+    runner.run(coordinator.async_refresh())
+    assert coordinator.async_read("speed") == 100
+
+
+def test_shutdown_timer_rounds_up(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """A shutdown timer with seconds left reads as the started minute."""
+    (device,) = start_fleet(1)
+    device.fake.state.shutdownTimer = 61
+    runner.run(device.coordinator.async_refresh())
+    assert device.coordinator.async_read("shutdownTimer") == 2
+
+
+def test_toggle(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """Switches send "on" and "off" and show the new value right away."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    for on in (True, False):
+        runner.run(coordinator.async_write("direction", value=on))
+        assert device.fake.state.direction is on
+        assert coordinator.async_read("direction") is on
+
+
+def test_effect(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """Selecting an effect by name sets its mode pack and index."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    effect, (pack, index) = list(coordinator.modes.effect_indices.items())[-1]
+    runner.run(coordinator.async_write("modeIndex", effect))
+    assert (device.fake.state.currentModpack, device.fake.state.modeIndex) == (
+        pack,
+        index,
+    )
+    assert coordinator.async_read("modeIndex") == effect
+    assert coordinator.async_read("currentModpack") == coordinator.modes.pack_name(pack)
+
+
+def test_music_sync_forced(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """Forced music sync reads as on and cannot be switched off."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    device.fake.state.musicSync = False
+    device.fake.state.forceMusicSync = True
+    device.fake.state.sceneGeneration = False
+    runner.run(coordinator.async_refresh())
+    assert coordinator.async_read("musicSync") is True
+    assert not coordinator.async_is_available("musicSync")
+    assert coordinator.async_is_available("autoChange")
+
+
+def test_auto_change_with_scene_generation(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """The effects do not cycle while the device generates scenes."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    runner.run(coordinator.async_write("sceneGeneration", value=True))
+    assert not coordinator.async_is_available("autoChange")
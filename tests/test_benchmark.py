@@ -0,0 +1,92 @@
+"""
+Benchmarks of the integration against fleets of simulated devices.
+
+Run with pytest-benchmark, for example:
+
+    python -m pytest tests/test_benchmark.py --benchmark-columns=median,max
+
+The state writes and CPU time of the steady state end up in the extra info
+of the steady state benchmarks, see --benchmark-json.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+from typing import TYPE_CHECKING
+
+import pytest
+from benchmark import async_measure_command, async_measure_steady_state
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from benchmark import BenchmarkDevice
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+FLEET_SIZES = (1, 10, 100)
+ROUNDS = 5
+STEADY_STATE_DURATION = 10.0
+# External state changes per device per minute during the steady state.
+CHANGE_RATE = 6.0
+
+
+@pytest.mark.parametrize("count", FLEET_SIZES)
+def test_poll(
+    benchmark: BenchmarkFixture,
+    runner: asyncio.Runner,
+    start_fleet: Callable[..., list[BenchmarkDevice]],
+    count: int,
+) -> None:
+    """Poll every device at once, sharing the fleet-wide poll slots."""
+    devices = start_fleet(count)
+
+    async def _async_poll() -> None:
+        await asyncio.gather(*(d.coordinator.async_refresh() for d in devices))
+
+    benchmark.pedantic(
+        lambda: runner.run(_async_poll()), rounds=ROUNDS, warmup_rounds=1
+    )
+    assert all(d.coordinator.last_update_success for d in devices)
+
+
+@pytest.mark.parametrize("count", FLEET_SIZES)
+def test_turn_on(
+    benchmark: BenchmarkFixture,
+    runner: asyncio.Runner,
+    start_fleet: Callable[..., list[BenchmarkDevice]],
+    count: int,
+) -> None:
+    """Turn on the light of every device at once, until acknowledged."""
+    devices = start_fleet(count)
+
+    async def _async_turn_on() -> list[tuple[float, float]]:
+        return await asyncio.gather(*(async_measure_command(d) for d in devices))
+
+    latencies = benchmark.pedantic(lambda: runner.run(_async_turn_on()), rounds=ROUNDS)
+    # The entity shows the new state long before the device acknowledges it.
+    benchmark.extra_info["to_state_median_ms"] = (
+        statistics.median(to_state for to_state, _ in latencies) * 1000
+    )
+
+
+@pytest.mark.parametrize("count", FLEET_SIZES)
+def test_steady_state(
+    benchmark: BenchmarkFixture,
+    runner: asyncio.Runner,
+    start_fleet: Callable[..., list[BenchmarkDevice]],
+    count: int,
+) -> None:
+    """Let the fleet poll on its own while the devices change now and then."""
+    devices = start_fleet(count, idle_interval=5.0)
+
+    writes_per_minute, cpu, kb_per_day = benchmark.pedantic(
+        lambda: runner.run(
+            async_measure_steady_state(devices, STEADY_STATE_DURATION, CHANGE_RATE)
+        ),
+        rounds=1,
+    )
+    benchmark.extra_info["writes_per_device_per_minute"] = writes_per_minute
+    benchmark.extra_info["cpu_ms_per_second_per_device"] = cpu
+    benchmark.extra_info["recorded_kb_per_device_per_day"] = kb_per_day["recorded"]
+    assert all(d.coordinator.last_update_success for d in devices)
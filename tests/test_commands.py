@@ -0,0 +1,96 @@
+"""Tests for the per-device command queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.exoy_one.commands import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_POWER_OFF,
+    ExoyOneCommandQueue,
+)
+
+
+async def _async_hold(queue: ExoyOneCommandQueue, release: asyncio.Event) -> None:
+    """Keep the device busy until released."""
+    await queue.async_run("hold", release.wait)
+
+
+def test_collapse(runner: asyncio.Runner) -> None:
+    """A queued call is replaced unsent by a newer call to the same key."""
+    queue = ExoyOneCommandQueue()
+    sent: list[int] = []
+
+    async def _async_send(value: int) -> None:
+        sent.append(value)
+
+    async def _async_run() -> tuple[bool, ...]:
+        release = asyncio.Event()
+        hold = asyncio.create_task(_async_hold(queue, release))
+        await asyncio.sleep(0)
+        calls = [
+            asyncio.create_task(queue.async_run("speed", lambda v=v: _async_send(v)))
+            for v in (1, 2, 3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await hold
+        return tuple(await asyncio.gather(*calls))
+
+    assert runner.run(_async_run()) == (False, False, True)
+    assert sent == [3]
+    assert queue.collapsed == 2
+
+
+def test_priority(runner: asyncio.Runner) -> None:
+    """Queued calls go out by priority, then in the order they came in."""
+    queue = ExoyOneCommandQueue()
+    sent: list[str] = []
+
+    async def _async_send(key: str) -> None:
+        sent.append(key)
+
+    async def _async_run() -> None:
+        release = asyncio.Event()
+        hold = asyncio.create_task(_async_hold(queue, release))
+        await asyncio.sleep(0)
+        calls = [
+            asyncio.create_task(
+                queue.async_run(key, lambda key=key: _async_send(key), priority=p)
+            )
+            for key, p in (
+                ("poll", PRIORITY_POLL),
+                ("color", PRIORITY_COMMAND),
+                ("power", PRIORITY_POWER_OFF),
+                ("speed", PRIORITY_COMMAND),
+            )
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(hold, *calls)
+
+    runner.run(_async_run())
+    assert sent == ["power", "color", "speed", "poll"]
+
+
+def test_cancelled_call_frees_device(runner: asyncio.Runner) -> None:
+    """Cancelling a queued call does not leave the device busy."""
+    queue = ExoyOneCommandQueue()
+
+    async def _async_run() -> bool:
+        release = asyncio.Event()
+        hold = asyncio.create_task(_async_hold(queue, release))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(
+            queue.async_run("speed", lambda: asyncio.sleep(0))
+        )
+        await asyncio.sleep(0)
+        waiting.cancel()
+        release.set()
+        await hold
+        return await asyncio.wait_for(
+            queue.async_run("color", lambda: asyncio.sleep(0)), 1
+        )
+
+    assert runner.run(_async_run())
@@ -0,0 +1,131 @@
+"""Tests for the coordinator and entities against simulated devices."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from exoyone import ExoyOneTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from benchmark import BenchmarkDevice
+
+
+async def _async_wait_for(condition: Callable[[], bool]) -> None:
+    """Wait until a condition holds."""
+    async with asyncio.timeout(5):
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+def test_poll(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """A poll picks up a change made on the device."""
+    (device,) = start_fleet(1)
+    device.fake.async_external_change()
+    runner.run(device.coordinator.async_refresh())
+    assert device.coordinator.data.brightness == device.fake.state.brightness
+
+
+def test_turn_on(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """Turning on the light reaches the device and shows right away."""
+    (device,) = start_fleet(1)
+    runner.run(device.light_entity.async_turn_on(brightness=42))
+    assert device.fake.state.brightness == 42
+    assert device.light_entity.brightness == 42
+
+
+def test_write_after_push_dropped(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """Writes keep working after the push connection drops."""
+    (device,) = start_fleet(1, push=True)
+    coordinator = device.coordinator
+    runner.run(_async_wait_for(lambda: coordinator.push_connected))
+    device.fake.async_drop_push()
+    runner.run(_async_wait_for(lambda: not coordinator.push_connected))
+    runner.run(coordinator.async_write("speed", 50))
+    assert device.fake.state.speed == int(50 / 100 * 255)
+
+
+def test_shutdown_timer(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """A new shutdown timer reads back as the minutes that were set."""
+    (device,) = start_fleet(1)
+    runner.run(device.coordinator.async_write("shutdownTimer", 30))
+    assert device.fake.state.shutdownTimer == 30 * 60
+    assert device.coordinator.async_read("shutdownTimer") == 30
+
+
+def test_color_after_poll(
+    runner: asyncio.Runner, start_fleet: Callable[..., list[BenchmarkDevice]]
+) -> None:
+    """A color set from Home Assistant reads back the same after a poll."""
+    (device,) = start_fleet(1)
+    light = device.light_entity
+    runner.run(light.async_turn_on(hs_color=(300, 50)))
+    assert light.hs_color == pytest.approx((300, 50), abs=1.5)
+    runner.run(device.coordinator.async_refresh())
+    assert light.hs_color == pytest.approx((300, 50), abs=1.5)
+    # The polled color matches the requested one, so nothing is sent again.
+    requests = device.fake.requests
+    runner.run(light.async_turn_on(hs_color=(300, 50)))
+    assert device.fake.requests == requests
+
+
+def test_push_during_command(
+    runner: asyncio.Runner,
+    start_fleet: Callable[..., list[BenchmarkDevice]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A state pushed before a command lands does not undo the command."""
+    (device,) = start_fleet(1)
+    coordinator = device.coordinator
+    old_state = device.client.state
+    set_brightness = device.client.set_brightness
+    release = asyncio.Event()
+
+    async def _async_slow_set_brightness(brightness: int) -> None:
+        await release.wait()
+        await set_brightness(brightness)
+
+    monkeypatch.setattr(device.client, "set_brightness", _async_slow_set_brightness)
+
+    async def _async_run() -> None:
+        command = asyncio.create_task(device.light_entity.async_turn_on(brightness=42))
+        await asyncio.sleep(0)
+        coordinator.async_handle_push(old_state)
+        assert coordinator.data.brightness == 42
+        release.set()
+        await command
+
+    runner.run(_async_run())
+    runner.run(coordinator.async_refresh())
+    assert coordinator.data.brightness == device.fake.state.brightness == 42
+
+
+def test_failed_command_reverts(
+    runner: asyncio.Runner,
+    start_fleet: Callable[..., list[BenchmarkDevice]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A command the device did not take puts the old value back."""
+    (device,) = start_fleet(1)
+    brightness = device.coordinator.data.brightness
+
+    async def _async_fail(_brightness: int) -> None:
+        raise ExoyOneTimeoutError
+
+    monkeypatch.setattr(device.client, "set_brightness", _async_fail)
+    with pytest.raises(ExoyOneTimeoutError):
+        runner.run(device.light_entity.async_turn_on(brightness=42))
+    assert device.light_entity.brightness == brightness
+    runner.run(device.coordinator.async_refresh())
+    assert device.light_entity.brightness == brightness
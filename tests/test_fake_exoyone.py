@@ -0,0 +1,83 @@
+"""Tests for the simulated Exoy ONE devices."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from typing import TYPE_CHECKING
+
+import pytest
+from exoyone import ExoyOne, ExoyOneState, ExoyOneTimeoutError
+from fake_exoyone import FakeNetwork, PushExoyOne, async_start_fleet
+
+if TYPE_CHECKING:
+    from fake_exoyone import FakeExoyOne
+
+
+def test_get_data(runner: asyncio.Runner, fake_device: FakeExoyOne) -> None:
+    """The library client reads the state of a simulated device."""
+    client = ExoyOne(host=fake_device.host)
+    state = runner.run(client.async_get_state())
+    assert state.mdnsName == fake_device.state.mdnsName
+    assert client.device_type == "Ultra Dense Dodecahedron"
+
+
+def test_set_color(
+    runner: asyncio.Runner, fake_device: FakeExoyOne, client: ExoyOne
+) -> None:
+    """A setter changes the device and reads the new state back."""
+    runner.run(client.set_color((10, 200, 100)))
+    assert (fake_device.state.hue, fake_device.state.saturation) == (10, 200)
+    assert fake_device.state.brightness == 100
+    assert client.state.brightness == 100
+    # One request to set the color and one to read it back.
+    assert fake_device.requests == 2
+
+
+def test_toggles_and_timer(
+    runner: asyncio.Runner, fake_device: FakeExoyOne, client: ExoyOne
+) -> None:
+    """Toggles switch fields on and off and the timer is kept in seconds."""
+    runner.run(client.toggle_power("off"))
+    runner.run(client.set_shutdown_timer(90))
+    assert fake_device.state.fadingOff is False
+    assert client.state.shutdownTimer == 90 * 60
+
+
+def test_packet_loss(runner: asyncio.Runner, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lost datagrams surface as timeouts once the library gives up."""
+    monkeypatch.setattr(ExoyOne, "TIMEOUT", 0.01)
+    (device,) = runner.run(async_start_fleet(1, FakeNetwork(loss=1.0)))
+    try:
+        with pytest.raises(ExoyOneTimeoutError):
+            runner.run(ExoyOne(host=device.host).async_get_data())
+    finally:
+        device.async_stop()
+        # pyExoyOne leaves the sockets of timed out requests to the garbage
+        # collector, which needs the event loop to close them.
+        gc.collect()
+
+
+def test_push(runner: asyncio.Runner, fake_device: FakeExoyOne) -> None:
+    """Subscribers get the current state, every change and the drop."""
+    client = PushExoyOne(host=fake_device.host)
+    states: list[ExoyOneState] = []
+    pushed = asyncio.Event()
+
+    def _on_state(state: ExoyOneState) -> None:
+        states.append(state)
+        pushed.set()
+
+    async def _async_listen() -> None:
+        listener = asyncio.create_task(client.async_listen(_on_state))
+        await pushed.wait()
+        pushed.clear()
+        fake_device.async_external_change()
+        await pushed.wait()
+        fake_device.async_drop_push()
+        await listener
+
+    with pytest.raises(ExoyOneTimeoutError):
+        runner.run(asyncio.wait_for(_async_listen(), timeout=5))
+    assert len(states) == 2
+    assert states[-1].brightness == fake_device.state.brightness
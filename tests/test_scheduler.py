@@ -0,0 +1,96 @@
+"""Tests for the domain-wide poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.exoy_one.const import MAX_CONCURRENT_POLLS
+from custom_components.exoy_one.scheduler import ExoyOnePollScheduler
+
+
+def test_max_concurrent_polls(runner: asyncio.Runner) -> None:
+    """No more polls than there are slots run at the same time."""
+    scheduler = ExoyOnePollScheduler()
+    active = peak = 0
+
+    async def _async_poll() -> None:
+        nonlocal active, peak
+        async with scheduler.async_poll_slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def _async_run() -> None:
+        await asyncio.gather(*(_async_poll() for _ in range(3 * MAX_CONCURRENT_POLLS)))
+
+    runner.run(_async_run())
+    assert peak == MAX_CONCURRENT_POLLS
+    assert active == 0
+
+
+def test_priority(runner: asyncio.Runner) -> None:
+    """Recently commanded devices get the next free slot first."""
+    scheduler = ExoyOnePollScheduler(max_concurrent=1)
+    order: list[str] = []
+
+    async def _async_poll(name: str, *, priority: bool) -> None:
+        async with scheduler.async_poll_slot(priority=priority):
+            order.append(name)
+
+    async def _async_run() -> None:
+        release = asyncio.Event()
+
+        async def _async_hold() -> None:
+            async with scheduler.async_poll_slot():
+                await release.wait()
+
+        hold = asyncio.create_task(_async_hold())
+        await asyncio.sleep(0)
+        polls = [
+            asyncio.create_task(_async_poll("idle", priority=False)),
+            asyncio.create_task(_async_poll("active", priority=True)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(hold, *polls)
+
+    runner.run(_async_run())
+    assert order == ["active", "idle"]
+
+
+def test_cancelled_waiter_frees_slot(runner: asyncio.Runner) -> None:
+    """Cancelling a poll that waits for a slot does not leak the slot."""
+    scheduler = ExoyOnePollScheduler(max_concurrent=1)
+
+    async def _async_run() -> None:
+        release = asyncio.Event()
+
+        async def _async_hold() -> None:
+            async with scheduler.async_poll_slot():
+                await release.wait()
+
+        async def _async_poll() -> None:
+            async with scheduler.async_poll_slot():
+                pass
+
+        hold = asyncio.create_task(_async_hold())
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(_async_poll())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        release.set()
+        await hold
+        await asyncio.wait_for(_async_poll(), 1)
+
+    runner.run(_async_run())
+
+
+def test_next_delay() -> None:
+    """Each device waits between half and one and a half intervals."""
+    scheduler = ExoyOnePollScheduler()
+    for index in range(10):
+        scheduler.async_register(f"entry_{index}")
+    for index in range(10):
+        delay = scheduler.async_next_delay(f"entry_{index}", 30)
+        assert 15 <= delay < 45
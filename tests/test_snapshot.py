@@ -0,0 +1,55 @@
+"""Tests for the immutable device state snapshots."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.exoy_one.const import STATE_FIELDS
+from custom_components.exoy_one.snapshot import ExoyOneSnapshot
+
+
+@pytest.fixture
+def snapshot() -> ExoyOneSnapshot:
+    """Return a snapshot with every field set to zero."""
+    return ExoyOneSnapshot(1, dict.fromkeys(STATE_FIELDS, 0))
+
+
+def test_immutable(snapshot: ExoyOneSnapshot) -> None:
+    """Fields and the version of a snapshot cannot change."""
+    with pytest.raises(AttributeError):
+        snapshot.brightness = 42
+    with pytest.raises(AttributeError):
+        snapshot.version = 2
+    with pytest.raises(AttributeError):
+        snapshot.unknown = 1
+    assert snapshot.brightness == 0
+
+
+def test_replace(snapshot: ExoyOneSnapshot) -> None:
+    """Replacing fields returns the next version and leaves the original."""
+    changed = snapshot.replace(brightness=42)
+    assert changed is not snapshot
+    assert changed.version == 2
+    assert changed["brightness"] == 42
+    assert snapshot.brightness == 0
+    assert changed.as_dict() == {**snapshot.as_dict(), "brightness": 42}
+
+
+def test_equality(snapshot: ExoyOneSnapshot) -> None:
+    """Snapshots compare by state, not by version."""
+    assert ExoyOneSnapshot(7, snapshot.as_dict()) == snapshot
+    assert snapshot.replace(hue=1) != snapshot
+
+
+def test_derive(snapshot: ExoyOneSnapshot) -> None:
+    """Derived values are computed once per snapshot."""
+    calls: list[ExoyOneSnapshot] = []
+
+    def _compute(data: ExoyOneSnapshot) -> int:
+        calls.append(data)
+        return data.brightness + 1
+
+    assert snapshot.derive("next", _compute) == 1
+    assert snapshot.derive("next", _compute) == 1
+    assert snapshot.replace(brightness=1).derive("next", _compute) == 2
+    assert len(calls) == 2